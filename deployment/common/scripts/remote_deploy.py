@@ -6,46 +6,15 @@ This script helps deploy the demo system to Windows machines over the network.
 """
 
 import os
+import hashlib
 import zipfile
 import shutil
-import subprocess
 import argparse
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
 
-def create_deployment_package():
-    """Create a deployment package with all necessary files."""
-    print("📦 Creating deployment package...")
-    
-    # Create deployment directory
-    deploy_dir = Path("deploy_package")
-    if deploy_dir.exists():
-        shutil.rmtree(deploy_dir)
-    deploy_dir.mkdir()
-    
-    # Copy necessary files
-    files_to_copy = [
-        ("deployment/setup_windows.ps1", "setup_windows.ps1"),
-        ("windows-client/platform_detection.py", "client/platform_detection.py"),
-        ("windows-client/demo_client.py", "client/demo_client.py"),
-        ("README.md", "README.md"),
-        ("docs/SETUP_GUIDE.md", "SETUP_GUIDE.md")
-    ]
-    
-    for src, dst in files_to_copy:
-        src_path = Path(src)
-        dst_path = deploy_dir / dst
-        
-        # Create directories if needed
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        if src_path.exists():
-            shutil.copy2(src_path, dst_path)
-            print(f"✅ Copied {src} -> {dst}")
-        else:
-            print(f"❌ Missing {src}")
-    
-    # Create a quick start script
-    quick_start = """@echo off
+# Static package files, encoded once at import
+_QUICK_START_BAT = """@echo off
 title AI Demo Setup
 echo ========================================
 echo AI Image Generation Demo - Quick Setup
@@ -61,13 +30,9 @@ powershell -ExecutionPolicy Bypass -File setup_windows.ps1
 echo.
 echo Setup complete! Check above for any errors.
 pause
-"""
-    
-    with open(deploy_dir / "QUICK_START.bat", "w") as f:
-        f.write(quick_start)
-    
-    # Create deployment instructions
-    instructions = """# Windows Machine Setup Instructions
+""".encode("ascii")
+
+_INSTRUCTIONS_MD = """# Windows Machine Setup Instructions
 
 ## Quick Setup (Recommended)
 
@@ -99,30 +64,9 @@ pause
 - `client/platform_detection.py` - Hardware detection
 - `client/demo_client.py` - Demo display application
 - `SETUP_GUIDE.md` - Detailed documentation
-"""
-    
-    with open(deploy_dir / "INSTRUCTIONS.md", "w") as f:
-        f.write(instructions)
-    
-    print(f"✅ Deployment package created in: {deploy_dir}")
-    return deploy_dir
-
-def create_zip_package(deploy_dir):
-    """Create a ZIP file of the deployment package."""
-    zip_path = Path("AI_Demo_Windows_Setup.zip")
-    
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in deploy_dir.rglob('*'):
-            if file_path.is_file():
-                arcname = file_path.relative_to(deploy_dir)
-                zipf.write(file_path, arcname)
-                
-    print(f"✅ ZIP package created: {zip_path}")
-    return zip_path
+""".encode("utf-8")
 
-def generate_deployment_methods():
-    """Generate instructions for different deployment methods."""
-    methods = """
+_DEPLOYMENT_METHODS_MD = """
 # 🚀 Deployment Methods (Choose the easiest for your situation)
 
 ## Method 1: USB Drive (Simplest - No network needed)
@@ -166,10 +110,117 @@ nmap -sn 192.168.1.0/24  # Adjust network range as needed
 # Or use:
 arp -a | grep -E "192\\.168\\.|10\\."
 ```
-"""
+""".encode("utf-8")
+
+# Files copied into the package, as (source, destination)
+_FILES_TO_COPY = [
+    ("deployment/setup_windows.ps1", "setup_windows.ps1"),
+    ("windows-client/platform_detection.py", "client/platform_detection.py"),
+    ("windows-client/demo_client.py", "client/demo_client.py"),
+    ("README.md", "README.md"),
+    ("docs/SETUP_GUIDE.md", "SETUP_GUIDE.md")
+]
+
+# Digest of the package contents, stored in the package and as the ZIP comment
+_MANIFEST_NAME = ".manifest"
+
+def _package_digest():
+    """Hash every package input so an unchanged package can be reused."""
+    h = hashlib.blake2b(digest_size=16)
+    for src, dst in _FILES_TO_COPY:
+        src_path = Path(src)
+        data = src_path.read_bytes() if src_path.exists() else b""
+        h.update(f"{dst}\0{src_path.exists()}\0{len(data)}\0".encode("utf-8"))
+        h.update(data)
+    h.update(_QUICK_START_BAT)
+    h.update(_INSTRUCTIONS_MD)
+    return h.hexdigest().encode("ascii")
+
+def create_deployment_package():
+    """Create a deployment package with all necessary files."""
+    print("📦 Creating deployment package...")
+    
+    deploy_dir = Path("deploy_package")
+    manifest_path = deploy_dir / _MANIFEST_NAME
+    digest = _package_digest()
+    
+    # Reuse the existing package when none of its inputs changed
+    if manifest_path.exists() and manifest_path.read_bytes() == digest:
+        print(f"✅ Deployment package up to date in: {deploy_dir}")
+        return deploy_dir
+    
+    # Create deployment directory
+    if deploy_dir.exists():
+        shutil.rmtree(deploy_dir)
+    deploy_dir.mkdir()
+    
+    # Create each destination directory once
+    for parent in {(deploy_dir / dst).parent for _, dst in _FILES_TO_COPY}:
+        parent.mkdir(parents=True, exist_ok=True)
+    
+    # Copy necessary files
+    copied = []
+    for src, dst in _FILES_TO_COPY:
+        src_path = Path(src)
+        dst_path = deploy_dir / dst
+        
+        if src_path.exists():
+            shutil.copyfile(src_path, dst_path)
+            copied.append((src_path, dst_path))
+            print(f"✅ Copied {src} -> {dst}")
+        else:
+            print(f"❌ Missing {src}")
+    
+    # Preserve permissions and timestamps like copy2, after the data copies
+    for src_path, dst_path in copied:
+        shutil.copystat(src_path, dst_path)
+    
+    # Create a quick start script
+    (deploy_dir / "QUICK_START.bat").write_bytes(_QUICK_START_BAT)
+    
+    # Create deployment instructions
+    (deploy_dir / "INSTRUCTIONS.md").write_bytes(_INSTRUCTIONS_MD)
+    
+    manifest_path.write_bytes(digest)
+    
+    print(f"✅ Deployment package created in: {deploy_dir}")
+    return deploy_dir
+
+def create_zip_package(deploy_dir):
+    """Create a ZIP file of the deployment package."""
+    zip_path = Path("AI_Demo_Windows_Setup.zip")
+    manifest_path = deploy_dir / _MANIFEST_NAME
+    digest = manifest_path.read_bytes() if manifest_path.exists() else b""
     
-    with open("DEPLOYMENT_METHODS.md", "w") as f:
-        f.write(methods)
+    # Skip re-zipping when the existing ZIP was built from the same package
+    if digest and zip_path.exists():
+        try:
+            with zipfile.ZipFile(zip_path) as zipf:
+                if zipf.comment == digest:
+                    print(f"✅ ZIP package up to date: {zip_path}")
+                    return zip_path
+        except zipfile.BadZipFile:
+            pass
+    
+    # Sorted entries with a fixed timestamp make the ZIP reproducible
+    file_paths = sorted(
+        p for p in deploy_dir.rglob('*') if p.is_file() and p.name != _MANIFEST_NAME
+    )
+    
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        zipf.comment = digest
+        for file_path in file_paths:
+            info = zipfile.ZipInfo.from_file(file_path, file_path.relative_to(deploy_dir))
+            info.date_time = (1980, 1, 1, 0, 0, 0)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            zipf.writestr(info, file_path.read_bytes(), compresslevel=1)
+                
+    print(f"✅ ZIP package created: {zip_path}")
+    return zip_path
+
+def generate_deployment_methods():
+    """Generate instructions for different deployment methods."""
+    Path("DEPLOYMENT_METHODS.md").write_bytes(_DEPLOYMENT_METHODS_MD)
     
     print("✅ Deployment methods guide created: DEPLOYMENT_METHODS.md")
 
@@ -202,7 +253,8 @@ def main():
     if args.serve:
         print(f"\n🌐 Starting HTTP server on port 8000...")
         print(f"Windows machines can download from: http://[YOUR_IP]:8000/{zip_path}")
-        subprocess.run(["python", "-m", "http.server", "8000"])
+        with ThreadingHTTPServer(("", 8000), SimpleHTTPRequestHandler) as httpd:
+            httpd.serve_forever()
     else:
         print(f"\n📋 Next steps:")
         print(f"1. Choose a deployment method from DEPLOYMENT_METHODS.md")
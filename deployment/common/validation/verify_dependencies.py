@@ -11,13 +11,71 @@ Usage:
     python verify_dependencies.py --fix-suggestions
 """
 
+import re
 import sys
 import platform
 import importlib
-import subprocess
+import importlib.metadata
+import importlib.util
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 import argparse
-from pathlib import Path
+
+
+def _normalize_dist_name(name: str) -> str:
+    """Normalize a distribution name as pip does (PEP 503)."""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
+@functools.lru_cache(maxsize=None)
+def _installed_versions() -> Dict[str, str]:
+    """Map every installed distribution to its version in one metadata scan."""
+    versions = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata['Name']
+        if name:
+            versions.setdefault(_normalize_dist_name(name), dist.version)
+    return versions
+
+
+@functools.lru_cache(maxsize=None)
+def _module_distributions() -> Dict[str, List[str]]:
+    """Map top-level import names to the distributions that provide them."""
+    if hasattr(importlib.metadata, 'packages_distributions'):
+        return importlib.metadata.packages_distributions()
+    
+    # Python 3.9 has no packages_distributions(); read top_level.txt instead
+    modules = {}
+    for dist in importlib.metadata.distributions():
+        for module in (dist.read_text('top_level.txt') or '').split():
+            modules.setdefault(module, []).append(dist.metadata['Name'])
+    return modules
+
+
+@functools.lru_cache(maxsize=None)
+def _find_package(package_name: str, import_name: str) -> Tuple[bool, str]:
+    """Look a package up in the installed distributions, then by module spec."""
+    versions = _installed_versions()
+    version = versions.get(_normalize_dist_name(package_name))
+    if version is not None:
+        return True, version
+    
+    # The module may ship under another distribution name, e.g. onnxruntime
+    # installed as onnxruntime-directml or onnxruntime-qnn
+    for dist_name in _module_distributions().get(import_name.partition('.')[0], ()):
+        version = versions.get(_normalize_dist_name(dist_name))
+        if version is not None:
+            return True, version
+    
+    # No dist-info (e.g. a source checkout on sys.path): locate the module
+    try:
+        spec = importlib.util.find_spec(import_name)
+    except (ImportError, ValueError) as e:
+        return False, str(e)
+    if spec is None:
+        return False, f"No module named '{import_name}'"
+    return True, 'unknown'
 
 
 class DependencyVerifier:
@@ -30,6 +88,7 @@ class DependencyVerifier:
             'missing': [],
             'errors': []
         }
+        self._onnx_providers = None
         
     def detect_platform(self) -> str:
         """Detect if we're on Snapdragon or Intel platform."""
@@ -59,15 +118,22 @@ class DependencyVerifier:
         return compatible
     
     def check_package(self, package_name: str, import_name: Optional[str] = None) -> Tuple[bool, str]:
-        """Check if a package is installed and importable."""
+        """Check if a package is installed, without running its import."""
         import_name = import_name or package_name
         
-        try:
-            module = importlib.import_module(import_name)
-            version = getattr(module, '__version__', 'unknown')
-            return True, version
-        except ImportError as e:
-            return False, str(e)
+        # Already imported (e.g. by an acceleration check): no lookup needed
+        module = sys.modules.get(import_name)
+        if module is not None:
+            return True, getattr(module, '__version__', 'unknown')
+        
+        return _find_package(package_name, import_name)
+    
+    def onnx_providers(self) -> Tuple[str, ...]:
+        """Return ONNX Runtime's execution providers, enumerated once and in priority order."""
+        if self._onnx_providers is None:
+            import onnxruntime as ort
+            self._onnx_providers = tuple(ort.get_available_providers())
+        return self._onnx_providers
     
     def verify_core_dependencies(self) -> int:
         """Verify core dependencies required by all platforms."""
@@ -93,17 +159,29 @@ class DependencyVerifier:
         
         missing_count = 0
         
-        for package_name, import_name in core_packages:
-            available, version_or_error = self.check_package(package_name, import_name)
-            
+        # Probe concurrently; results come back in list order for printing
+        # Fill the metadata caches once up front; left cold, every worker
+        # would miss them and rescan the installed distributions at once
+        _installed_versions()
+        _module_distributions()
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            checks = list(executor.map(lambda pkg: self.check_package(*pkg), core_packages))
+        
+        # Emit the section in one write rather than a print per package
+        lines = []
+        for (package_name, _), (available, version_or_error) in zip(core_packages, checks):
             if available:
                 self.results['core'].append(f"✅ {package_name}: {version_or_error}")
-                print(f"  ✅ {package_name}: {version_or_error}")
+                lines.append(f"  ✅ {package_name}: {version_or_error}")
             else:
                 self.results['missing'].append(f"❌ {package_name}: Missing")
-                print(f"  ❌ {package_name}: Missing")
+                lines.append(f"  ❌ {package_name}: Missing")
                 missing_count += 1
         
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        
         return missing_count
     
     def verify_snapdragon_acceleration(self) -> bool:
@@ -112,8 +190,7 @@ class DependencyVerifier:
         
         # Check ONNX Runtime QNN support
         try:
-            import onnxruntime as ort
-            providers = ort.get_available_providers()
+            providers = self.onnx_providers()
             
             qnn_available = 'QNNExecutionProvider' in providers
             
@@ -176,8 +253,7 @@ class DependencyVerifier:
         
         # Check ONNX Runtime DirectML
         try:
-            import onnxruntime as ort
-            providers = ort.get_available_providers()
+            providers = self.onnx_providers()
             
             directml_onnx = 'DmlExecutionProvider' in providers
             
@@ -216,6 +292,14 @@ class DependencyVerifier:
         """Test basic AI pipeline functionality."""
         print("\n🧪 Testing Basic AI Pipeline...")
         
+        # A missing stack fails here, before torch/diffusers pay their import cost
+        for module_name in ('torch', 'diffusers', 'onnxruntime'):
+            if importlib.util.find_spec(module_name) is None:
+                error = f"No module named '{module_name}'"
+                self.results['errors'].append(f"Basic functionality test failed: {error}")
+                print(f"  ❌ Basic functionality test failed: {error}")
+                return False
+        
         try:
             # Test PyTorch tensor creation
             import torch
@@ -263,8 +347,9 @@ class DependencyVerifier:
         
         if self.results['errors']:
             suggestions.append("🔧 PLATFORM-SPECIFIC ISSUES:")
+            errors_text = ' '.join(self.results['errors'])
             
-            if 'DirectML' in ' '.join(self.results['errors']):
+            if 'DirectML' in errors_text:
                 suggestions.extend([
                     "DirectML Issues:",
                     "- Ensure Windows 10 1903+ or Windows 11",
@@ -274,7 +359,7 @@ class DependencyVerifier:
                     ""
                 ])
             
-            if 'QNN' in ' '.join(self.results['errors']):
+            if 'QNN' in errors_text:
                 suggestions.extend([
                     "Snapdragon NPU Issues:",
                     "- Download Qualcomm AI Engine from developer portal",
@@ -5,11 +5,174 @@ Tests syntax, structure, error handling, and cross-references
 """
 
 import re
-import os
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Tuple
-import json
+
+# Tokens counted by the checks that need regex features, matched together
+# in one pass over the script (see _scan_script). Names that other tokens
+# may contain are captured with lookaheads so the rest of the scan still
+# sees them.
+_TOKEN_RE = re.compile(
+    r'(?P<func>function\s+(?=(?P<func_name>[\w-]+)))'
+    r'|(?P<switch>\[switch\]\$(?=(?P<switch_name>\w+)))'
+    r'|(?P<try>\btry\s*\{)'
+    r'|(?P<catch>\bcatch\s*\{)'
+    r'|(?P<finally>\bfinally\s*\{)'
+    r'|(?P<wc_new>New-Object\s+System\.Net\.WebClient)'
+    r'|(?P<cleanup_transcript>Stop-Transcript)'
+    r'|(?P<cleanup_dispose>Dispose\(\))'
+    r'|(?P<cleanup_close>Close\(\))'
+    r'|(?P<cleanup_location>Pop-Location)'
+)
+
+# Token kinds that count as resource cleanup
+_CLEANUP_KINDS = ('cleanup_transcript', 'cleanup_dispose', 'cleanup_close', 'cleanup_location')
+
+# Plain-text tokens, counted with str.count instead of the regex engine
+_LITERAL_TOKENS = {
+    'wc_dispose': ('$webClient.Dispose()',),
+    'rollback_register': ('Register-RollbackAction',),
+    'rollback_invoke': ('Invoke-Rollback',),
+    'should_process': ('$PSCmdlet.ShouldProcess',),
+    'step': ('Write-StepProgress',),
+    'script_scope': ('$script:',),
+    'fp16': ('FP16', 'fp16'),
+}
+
+# Case-insensitive tokens, counted in a lowercased copy of the script
+_NOCASE_LITERAL_TOKENS = {
+    'directml': ('directml',),
+    'mkl': ('mkl',),
+}
+_AVX512_LOWER_RE = re.compile(r'avx.?512')
+
+# Functions the Intel script must define, in report order
+_EXPECTED_FUNCTIONS = (
+    'Write-StepProgress', 'Write-ErrorMsg', 'Write-WarningMsg',
+    'Write-Success', 'Write-Info', 'Write-VerboseInfo',
+    'Initialize-Logging', 'Stop-Logging', 'Register-RollbackAction',
+    'Invoke-Rollback', 'Initialize-Directories', 'Test-IntelHardwareRequirements',
+    'Show-HardwareConfirmation', 'Install-Python', 'Install-CoreDependencies',
+    'Install-IntelAcceleration', 'Configure-DirectMLProvider', 'Download-IntelModels',
+    'Download-SimpleFile', 'Download-WithResume', 'Create-StartupScripts',
+    'Configure-Network', 'Test-IntelPerformance', 'Update-Repository',
+    'Show-PerformanceExpectations', 'Generate-Report', 'Main'
+)
+
+# Definitions of any expected function, as a fallback for names the token
+# scan did not capture
+_EXPECTED_FUNC_RE = re.compile(
+    r'function\s+(' + '|'.join(re.escape(func) for func in _EXPECTED_FUNCTIONS) + r')\s*[{(]'
+)
+
+# Report bullet marker for each kind of logged result
+_REPORT_MARKERS = {'PASS': '✅', 'FAIL': '❌', 'WARN': '⚠️'}
+
+# One-off patterns, compiled once at import
+_DATETIME_RE = re.compile(r'\$\([^)]*Get-Date[^)]*\)')
+_BAD_INTERP_RE = re.compile(r'\$\{[^}]+\}')
+_RESERVED_ERROR_RE = re.compile(r'\$error\s*=')
+_MEMORY_16GB_RE = re.compile(r'16\s*GB|16GB')
+_STORAGE_10GB_RE = re.compile(r'10\s*GB|10GB')
+_MODEL_SIZE_RE = re.compile(r'6\.9\s*GB|6\.9GB|6900\s*MB')
+_PERF_TARGET_RE = re.compile(r'35-45\s*seconds|35\s*-\s*45\s*seconds')
+_WINDOWS11_RE = re.compile(r'Windows\s*11|Windows 11')
+_DIRECTX12_RE = re.compile(r'DirectX\s*12|DirectX12')
+
+
+def _count(pattern: re.Pattern, content: str) -> int:
+    """Number of matches of pattern in content, without building a match list"""
+    return sum(1 for _ in pattern.finditer(content))
+
+
+def _scan_script(content: str) -> dict:
+    """Count the _TOKEN_RE and literal tokens in the script"""
+    counts = Counter({
+        kind: sum(content.count(literal) for literal in literals)
+        for kind, literals in _LITERAL_TOKENS.items()
+    })
+    
+    # Fold case once rather than scanning with re.IGNORECASE
+    content_lower = content.lower()
+    for kind, literals in _NOCASE_LITERAL_TOKENS.items():
+        counts[kind] = sum(content_lower.count(literal) for literal in literals)
+    counts['avx512'] = _count(_AVX512_LOWER_RE, content_lower)
+    
+    functions = []
+    function_starts = []
+    switches = []
+    for match in _TOKEN_RE.finditer(content):
+        kind = match.lastgroup
+        counts[kind] += 1
+        if kind == 'func':
+            functions.append(match.group('func_name'))
+            function_starts.append((match.group('func_name'), match.start()))
+        elif kind == 'switch':
+            switches.append(match.group('switch_name'))
+    return {
+        'counts': counts,
+        'functions': functions,
+        'function_starts': function_starts,
+        'switches': switches
+    }
+
+
+def _block_end(content: str, start: int) -> int:
+    """Index just past the brace block opened by the first '{' after start.
+    
+    Braces inside comments and string literals are ignored. Returns
+    len(content) if the block is never closed.
+    """
+    depth = 0
+    i = start
+    n = len(content)
+    while i < n:
+        char = content[i]
+        if char == '#':
+            i = content.find('\n', i)
+            if i < 0:
+                return n
+        elif char == '<' and content.startswith('<#', i):
+            i = content.find('#>', i + 2)
+            if i < 0:
+                return n
+            i += 1
+        elif char == '@' and content.startswith(('@"', "@'"), i):
+            # Here-string: runs until the quote and '@' at the start of a line
+            i = content.find('\n' + content[i + 1] + '@', i + 2)
+            if i < 0:
+                return n
+            i += 2
+        elif char == "'":
+            i = content.find("'", i + 1)
+            if i < 0:
+                return n
+        elif char == '"':
+            i += 1
+            while i < n and content[i] != '"':
+                if content[i] == '`':
+                    i += 1
+                i += 1
+        elif char == '{':
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return n
+
+
+def _extract_function_bodies(content: str, functions) -> dict[str, str]:
+    """Map each defined function name to its source, from 'function' to its closing brace"""
+    bodies = {}
+    for name, start in functions:
+        if name not in bodies:
+            bodies[name] = content[start:_block_end(content, start)]
+    return bodies
 
 class IntelDeploymentTester:
     def __init__(self):
@@ -24,40 +187,128 @@ class IntelDeploymentTester:
         }
         self.issues_found = []
         
+        # Logged sections and results in order, and results bucketed by
+        # kind, for the report
+        self._entries = []
+        self._by_kind = {kind: [] for kind in _REPORT_MARKERS}
+        
+        # Per-thread log buffer while checks run concurrently (see run_tests)
+        self._local = threading.local()
+        
+        # Script contents, read on first use and shared by every test
+        self._content = None
+        self._snapdragon_content = None
+        self._scan = None
+        self._bodies = None
+        
     def log_pass(self, message: str):
         """Log a passing test"""
+        if self._defer(self.log_pass, message):
+            return
         print(f"✅ [PASS] {message}")
         self.test_results["passed"] += 1
-        self.test_results["details"].append(f"[PASS] {message}")
+        self._record('PASS', message)
         
     def log_fail(self, message: str):
         """Log a failing test"""
+        if self._defer(self.log_fail, message):
+            return
         print(f"❌ [FAIL] {message}")
         self.test_results["failed"] += 1
-        self.test_results["details"].append(f"[FAIL] {message}")
+        self._record('FAIL', message)
         self.issues_found.append(message)
         
     def log_warn(self, message: str):
         """Log a warning"""
+        if self._defer(self.log_warn, message):
+            return
         print(f"⚠️  [WARN] {message}")
         self.test_results["warnings"] += 1
-        self.test_results["details"].append(f"[WARN] {message}")
+        self._record('WARN', message)
+        
+    def _defer(self, log_method, message: str) -> bool:
+        """Buffer a log call made from a worker thread; True if buffered"""
+        events = getattr(self._local, 'events', None)
+        if events is None:
+            return False
+        events.append((log_method, message))
+        return True
+        
+    def _run_buffered(self, test):
+        """Run one check, returning (buffered log calls, exception or None)"""
+        self._local.events = []
+        try:
+            test()
+            return self._local.events, None
+        except Exception as e:
+            return self._local.events, e
+        finally:
+            self._local.events = None
+    
+    def run_tests(self, tests):
+        """Run the checks concurrently and replay their logs in test order"""
+        # Fill the shared caches first so the workers only read them
+        try:
+            self.function_bodies()
+        except Exception:
+            pass  # Each check reports a missing script itself
+        
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(self._run_buffered, test) for test in tests]
+            for future in futures:
+                events, error = future.result()
+                for log_method, message in events:
+                    log_method(message)
+                if error is not None:
+                    print(f"❌ Test failed with exception: {error}")
+        
+    def _record(self, kind: str, message: str):
+        """Keep a logged result for the summary and the report"""
+        self.test_results["details"].append(f"[{kind}] {message}")
+        self._entries.append((kind, message))
+        self._by_kind[kind].append(message)
         
     def log_info(self, message: str):
         """Log information"""
+        if self._defer(self.log_info, message):
+            return
         print(f"ℹ️  [INFO] {message}")
         
     def log_section(self, title: str):
         """Log a section header"""
+        if self._defer(self.log_section, title):
+            return
         print(f"\n{'=' * 60}")
         print(f"  {title}")
         print(f"{'=' * 60}")
+        self._entries.append(('SECTION', title))
         
     def read_script(self) -> str:
-        """Read the Intel deployment script"""
-        if not self.script_path.exists():
-            raise FileNotFoundError(f"Script not found: {self.script_path}")
-        return self.script_path.read_text(encoding='utf-8')
+        """Read the Intel deployment script (cached after the first read)"""
+        if self._content is None:
+            if not self.script_path.exists():
+                raise FileNotFoundError(f"Script not found: {self.script_path}")
+            self._content = self.script_path.read_text(encoding='utf-8')
+        return self._content
+    
+    def scan_script(self) -> dict:
+        """Token counts for the Intel script (scanned once, then cached)"""
+        if self._scan is None:
+            self._scan = _scan_script(self.read_script())
+        return self._scan
+    
+    def function_bodies(self) -> dict[str, str]:
+        """Source of each function in the Intel script (extracted once, then cached)"""
+        if self._bodies is None:
+            self._bodies = _extract_function_bodies(
+                self.read_script(), self.scan_script()['function_starts'])
+        return self._bodies
+    
+    def read_snapdragon_script(self) -> str:
+        """Read the Snapdragon deployment script (cached after the first read)"""
+        if self._snapdragon_content is None:
+            self._snapdragon_content = self.snapdragon_path.read_text(encoding='utf-8')
+        return self._snapdragon_content
     
     def test_syntax_analysis(self) -> bool:
         """Test 1: Static Syntax Analysis"""
@@ -65,45 +316,31 @@ class IntelDeploymentTester:
         
         try:
             content = self.read_script()
+            scan = self.scan_script()
             
             # Check for basic PowerShell syntax
             self.log_info("Checking PowerShell syntax patterns...")
             
             # Check for proper function definitions
-            # PowerShell functions can have hyphens in names
-            function_pattern = r'function\s+([\w-]+)'
-            functions = re.findall(function_pattern, content)
-            
-            expected_functions = [
-                'Write-StepProgress', 'Write-ErrorMsg', 'Write-WarningMsg',
-                'Write-Success', 'Write-Info', 'Write-VerboseInfo',
-                'Initialize-Logging', 'Stop-Logging', 'Register-RollbackAction',
-                'Invoke-Rollback', 'Initialize-Directories', 'Test-IntelHardwareRequirements',
-                'Show-HardwareConfirmation', 'Install-Python', 'Install-CoreDependencies',
-                'Install-IntelAcceleration', 'Configure-DirectMLProvider', 'Download-IntelModels',
-                'Download-SimpleFile', 'Download-WithResume', 'Create-StartupScripts',
-                'Configure-Network', 'Test-IntelPerformance', 'Update-Repository',
-                'Show-PerformanceExpectations', 'Generate-Report', 'Main'
-            ]
-            
-            # Check if function exists using more robust search
-            for func in expected_functions:
-                # Try both patterns - with and without hyphen consideration
-                if func in functions or re.search(rf'function\s+{re.escape(func)}\s*[{{(]', content):
+            functions = set(scan['functions'])
+            functions.update(_EXPECTED_FUNC_RE.findall(content))
+            
+            for func in _EXPECTED_FUNCTIONS:
+                if func in functions:
                     self.log_pass(f"Function '{func}' properly defined")
                 else:
                     self.log_fail(f"Function '{func}' not found")
             
             # Check DateTime handling with proper parentheses
-            datetime_patterns = re.findall(r'\$\([^)]*Get-Date[^)]*\)', content)
+            datetime_patterns = _count(_DATETIME_RE, content)
             if datetime_patterns:
-                self.log_pass(f"DateTime handling uses proper parentheses ({len(datetime_patterns)} instances)")
+                self.log_pass(f"DateTime handling uses proper parentheses ({datetime_patterns} instances)")
             else:
                 self.log_warn("No DateTime patterns with parentheses found")
             
             # Check WebClient disposal
-            webclient_creates = len(re.findall(r'New-Object\s+System\.Net\.WebClient', content))
-            webclient_disposes = len(re.findall(r'\$webClient\.Dispose\(\)', content))
+            webclient_creates = scan['counts']['wc_new']
+            webclient_disposes = scan['counts']['wc_dispose']
             
             if webclient_creates == webclient_disposes and webclient_creates > 0:
                 self.log_pass(f"WebClient disposal properly implemented ({webclient_creates} instances)")
@@ -111,21 +348,21 @@ class IntelDeploymentTester:
                 self.log_fail(f"WebClient instances: {webclient_creates}, Dispose calls: {webclient_disposes}")
             
             # Check for incorrect string interpolation
-            bad_interpolation = re.findall(r'\$\{[^}]+\}', content)
+            bad_interpolation = _count(_BAD_INTERP_RE, content)
             if not bad_interpolation:
                 self.log_pass("No incorrect string interpolation syntax found")
             else:
-                self.log_fail(f"Found {len(bad_interpolation)} incorrect string interpolations")
+                self.log_fail(f"Found {bad_interpolation} incorrect string interpolations")
             
             # Check for Unicode characters
-            non_ascii = re.findall(r'[^\x00-\x7F]', content)
-            if not non_ascii:
+            if content.isascii():
                 self.log_pass("No Unicode characters found (ASCII-only)")
             else:
-                self.log_fail(f"Found {len(non_ascii)} non-ASCII characters")
+                non_ascii = sum(1 for char in content if ord(char) > 127)
+                self.log_fail(f"Found {non_ascii} non-ASCII characters")
                 
             # Check for reserved variable conflicts
-            if re.search(r'\$error\s*=', content):
+            if _RESERVED_ERROR_RE.search(content):
                 self.log_fail("Using reserved variable $error")
             else:
                 self.log_pass("No reserved variable conflicts")
@@ -148,11 +385,12 @@ class IntelDeploymentTester:
         
         try:
             content = self.read_script()
+            counts = self.scan_script()['counts']
             
             # Count try/catch/finally blocks
-            try_blocks = len(re.findall(r'\btry\s*\{', content))
-            catch_blocks = len(re.findall(r'\bcatch\s*\{', content))
-            finally_blocks = len(re.findall(r'\bfinally\s*\{', content))
+            try_blocks = counts['try']
+            catch_blocks = counts['catch']
+            finally_blocks = counts['finally']
             
             self.log_info(f"Try blocks: {try_blocks}")
             self.log_info(f"Catch blocks: {catch_blocks}")
@@ -164,8 +402,8 @@ class IntelDeploymentTester:
                 self.log_fail(f"Mismatch: {try_blocks} try blocks, {catch_blocks} catch blocks")
             
             # Check for rollback mechanism
-            rollback_registers = len(re.findall(r'Register-RollbackAction', content))
-            rollback_invokes = len(re.findall(r'Invoke-Rollback', content))
+            rollback_registers = counts['rollback_register']
+            rollback_invokes = counts['rollback_invoke']
             
             if rollback_registers > 0 and rollback_invokes > 0:
                 self.log_pass(f"Rollback mechanism implemented ({rollback_registers} registrations)")
@@ -179,8 +417,7 @@ class IntelDeploymentTester:
                 self.log_warn("ErrorActionPreference not set to Stop")
             
             # Check cleanup patterns
-            cleanup_patterns = ['Stop-Transcript', 'Dispose()', 'Close()', 'Pop-Location']
-            cleanup_found = sum(1 for pattern in cleanup_patterns if pattern in content)
+            cleanup_found = sum(1 for kind in _CLEANUP_KINDS if counts[kind])
             
             if cleanup_found >= 3:
                 self.log_pass(f"Proper cleanup patterns found ({cleanup_found} types)")
@@ -204,16 +441,17 @@ class IntelDeploymentTester:
         self.log_section("3. DRY RUN TESTING SUPPORT")
         
         try:
-            content = self.read_script()
+            scan = self.scan_script()
+            switches = scan['switches']
             
             # Check for -WhatIf parameter
-            if re.search(r'\[switch\]\$WhatIf', content):
+            if 'WhatIf' in switches:
                 self.log_pass("-WhatIf parameter defined")
             else:
                 self.log_fail("-WhatIf parameter not found")
             
             # Check for ShouldProcess implementation
-            should_process_count = len(re.findall(r'\$PSCmdlet\.ShouldProcess', content))
+            should_process_count = scan['counts']['should_process']
             
             if should_process_count > 0:
                 self.log_pass(f"ShouldProcess implemented ({should_process_count} instances)")
@@ -221,13 +459,13 @@ class IntelDeploymentTester:
                 self.log_fail("ShouldProcess not implemented")
             
             # Check for -CheckOnly parameter
-            if re.search(r'\[switch\]\$CheckOnly', content):
+            if 'CheckOnly' in switches:
                 self.log_pass("-CheckOnly parameter defined")
             else:
                 self.log_warn("-CheckOnly parameter not found")
                 
             # Check for -Force parameter
-            if re.search(r'\[switch\]\$Force', content):
+            if 'Force' in switches:
                 self.log_pass("-Force parameter defined")
             else:
                 self.log_warn("-Force parameter not found")
@@ -243,7 +481,8 @@ class IntelDeploymentTester:
         self.log_section("4. MODULE AND FUNCTION TESTING")
         
         try:
-            content = self.read_script()
+            functions = set(self.scan_script()['functions'])
+            bodies = self.function_bodies()
             
             # Critical functions that must exist
             critical_functions = {
@@ -256,26 +495,25 @@ class IntelDeploymentTester:
             }
             
             for func_name, description in critical_functions.items():
-                if f'function {func_name}' in content:
+                if func_name in functions:
                     self.log_pass(f"Function '{func_name}' exists - {description}")
                     
                     # Additional checks for specific functions
                     if func_name == 'Test-IntelHardwareRequirements':
                         # Check for Intel Core Ultra detection
-                        func_content = re.search(rf'function {func_name}.*?^}}', content, re.MULTILINE | re.DOTALL)
-                        if func_content and 'Intel.*Core.*Ultra' in func_content.group():
+                        # (the literal -match pattern used by the script)
+                        if 'Intel.*Core.*Ultra' in bodies.get(func_name, ''):
                             self.log_pass("Intel Core Ultra detection present")
                         else:
                             self.log_warn("Intel Core Ultra detection not found")
                             
                     elif func_name == 'Configure-DirectMLProvider':
                         # Check for DirectML environment variables
-                        func_content = re.search(rf'function {func_name}.*?^}}', content, re.MULTILINE | re.DOTALL)
-                        if func_content:
-                            if 'ORT_DIRECTML_DEVICE_ID' in func_content.group():
-                                self.log_pass("DirectML device configuration present")
-                            if 'MKL_ENABLE_INSTRUCTIONS' in func_content.group():
-                                self.log_pass("Intel MKL optimization configuration present")
+                        body = bodies.get(func_name, '')
+                        if 'ORT_DIRECTML_DEVICE_ID' in body:
+                            self.log_pass("DirectML device configuration present")
+                        if 'MKL_ENABLE_INSTRUCTIONS' in body:
+                            self.log_pass("Intel MKL optimization configuration present")
                 else:
                     self.log_fail(f"Function '{func_name}' not found - {description}")
                     
@@ -296,11 +534,12 @@ class IntelDeploymentTester:
                 self.log_warn("Snapdragon script not found for comparison")
                 return True
                 
-            snapdragon_content = self.snapdragon_path.read_text(encoding='utf-8')
+            snapdragon_content = self.read_snapdragon_script()
+            counts = self.scan_script()['counts']
             
             # Compare progress steps
-            intel_steps = len(re.findall(r'Write-StepProgress', intel_content))
-            snapdragon_steps = len(re.findall(r'Write-StepProgress', snapdragon_content))
+            intel_steps = counts['step']
+            snapdragon_steps = _scan_script(snapdragon_content)['counts']['step']
             
             if abs(intel_steps - snapdragon_steps) <= 2:
                 self.log_pass(f"Progress steps aligned (Intel: {intel_steps}, Snapdragon: {snapdragon_steps})")
@@ -308,21 +547,21 @@ class IntelDeploymentTester:
                 self.log_warn(f"Progress steps differ (Intel: {intel_steps}, Snapdragon: {snapdragon_steps})")
             
             # Check Intel-specific features
-            directml_count = len(re.findall(r'DirectML', intel_content, re.IGNORECASE))
+            directml_count = counts['directml']
             if directml_count >= 30:
                 self.log_pass(f"DirectML references found: {directml_count}")
             else:
                 self.log_warn(f"DirectML references: {directml_count} (expected 30+)")
             
             # Check AVX-512 optimizations
-            avx512_count = len(re.findall(r'AVX.?512', intel_content, re.IGNORECASE))
+            avx512_count = counts['avx512']
             if avx512_count >= 5:
                 self.log_pass(f"AVX-512 optimizations found: {avx512_count}")
             else:
                 self.log_warn(f"AVX-512 references: {avx512_count} (expected 5+)")
             
             # Check Intel MKL references
-            mkl_count = len(re.findall(r'MKL', intel_content, re.IGNORECASE))
+            mkl_count = counts['mkl']
             if mkl_count >= 5:
                 self.log_pass(f"Intel MKL references found: {mkl_count}")
             else:
@@ -348,31 +587,31 @@ class IntelDeploymentTester:
             content = self.read_script()
             
             # Memory requirement checks
-            if re.search(r'16\s*GB|16GB', content):
+            if _MEMORY_16GB_RE.search(content):
                 self.log_pass("16GB minimum memory requirement specified")
             else:
                 self.log_fail("16GB memory requirement not found")
             
             # Storage space validation
-            if re.search(r'10\s*GB|10GB', content):
+            if _STORAGE_10GB_RE.search(content):
                 self.log_pass("10GB storage requirement specified")
             else:
                 self.log_fail("10GB storage requirement not found")
             
             # Model size warnings
-            if re.search(r'6\.9\s*GB|6\.9GB|6900\s*MB', content):
+            if _MODEL_SIZE_RE.search(content):
                 self.log_pass("6.9GB model size warning present")
             else:
                 self.log_warn("6.9GB model size not properly specified")
             
             # Performance expectations
-            if re.search(r'35-45\s*seconds|35\s*-\s*45\s*seconds', content):
+            if _PERF_TARGET_RE.search(content):
                 self.log_pass("35-45 seconds performance expectation specified")
             else:
                 self.log_fail("Performance expectation not properly specified")
             
             # FP16 model handling
-            fp16_count = len(re.findall(r'FP16|fp16', content))
+            fp16_count = self.scan_script()['counts']['fp16']
             if fp16_count >= 5:
                 self.log_pass(f"FP16 model handling implemented ({fp16_count} references)")
             else:
@@ -392,19 +631,19 @@ class IntelDeploymentTester:
             content = self.read_script()
             
             # Windows 11 compatibility
-            if re.search(r'Windows\s*11|Windows 11', content):
+            if _WINDOWS11_RE.search(content):
                 self.log_pass("Windows 11 compatibility mentioned")
             else:
                 self.log_warn("Windows 11 not explicitly mentioned")
             
             # Python version compatibility
-            if re.search(r'3\.9|3\.10', content):
+            if '3.9' in content or '3.10' in content:
                 self.log_pass("Python 3.9/3.10 compatibility specified")
             else:
                 self.log_fail("Python version compatibility not specified")
             
             # DirectX 12 requirement
-            if re.search(r'DirectX\s*12|DirectX12', content):
+            if _DIRECTX12_RE.search(content):
                 self.log_pass("DirectX 12 requirement specified")
             else:
                 self.log_fail("DirectX 12 requirement not found")
@@ -442,7 +681,8 @@ class IntelDeploymentTester:
                 self.log_warn("ProgressReporter class not found")
             
             # Check for proper parameter definitions
-            params = re.findall(r'\[switch\]\$(\w+)', content)
+            scan = self.scan_script()
+            params = scan['switches']
             expected_params = ['CheckOnly', 'Force', 'WhatIf', 'Verbose', 'SkipModelDownload', 'UseHttpRange']
             
             for param in expected_params:
@@ -460,7 +700,7 @@ class IntelDeploymentTester:
                 self.log_warn("OptimizationProfile parameter not found")
                 
             # Check script scope variables
-            script_vars = len(re.findall(r'\$script:', content))
+            script_vars = scan['counts']['script_scope']
             if script_vars > 10:
                 self.log_pass(f"Proper use of script scope variables ({script_vars} instances)")
             else:
@@ -472,8 +712,10 @@ class IntelDeploymentTester:
             self.log_fail(f"Specific issue checks failed: {e}")
             return False
     
-    def generate_report(self) -> str:
-        """Generate comprehensive test report"""
+    def generate_report(self) -> tuple[str, int]:
+        """Generate comprehensive test report, returning (report, exit code)"""
+        from datetime import datetime
+        
         self.log_section("TEST SUMMARY REPORT")
         
         total = self.test_results["passed"] + self.test_results["failed"] + self.test_results["warnings"]
@@ -484,7 +726,8 @@ class IntelDeploymentTester:
         print(f"  ⚠️  Warnings: {self.test_results['warnings']}")
         print(f"  📝 Total:    {total}")
         
-        if self.test_results["failed"] == 0:
+        exit_code = 0 if self.test_results["failed"] == 0 else 1
+        if exit_code == 0:
             status = "PASSED"
             print("\n✨ [SUCCESS] All critical tests passed!")
         elif self.test_results["failed"] <= 2:
@@ -498,7 +741,7 @@ class IntelDeploymentTester:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_path = Path(__file__).parent / f"INTEL_TESTING_REPORT_{timestamp}.md"
         
-        report = f"""# Intel Deployment Script Testing Report
+        parts = [f"""# Intel Deployment Script Testing Report
 
 Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 Status: **{status}**
@@ -514,45 +757,41 @@ Status: **{status}**
 
 ## Detailed Results
 
-"""
+"""]
         
-        # Add test details
-        current_section = None
-        for detail in self.test_results["details"]:
-            # Check if this is a section header (numbered sections)
-            if ". " in detail and detail.split(". ")[0].isdigit():
-                if current_section:
-                    report += "\n"
-                current_section = detail
-                report += f"### {detail}\n\n"
-            else:
-                # Format test result
-                if "[PASS]" in detail:
-                    report += f"- ✅ {detail.replace('[PASS] ', '')}\n"
-                elif "[FAIL]" in detail:
-                    report += f"- ❌ {detail.replace('[FAIL] ', '')}\n"
-                elif "[WARN]" in detail:
-                    report += f"- ⚠️ {detail.replace('[WARN] ', '')}\n"
-                elif "[INFO]" in detail:
-                    report += f"- ℹ️ {detail.replace('[INFO] ', '')}\n"
+        # Add test details, headed by the section they were logged under
+        # (headers are written lazily so empty sections are skipped)
+        section = None
+        first_section = True
+        for kind, message in self._entries:
+            if kind == 'SECTION':
+                section = message
+                continue
+            if section is not None:
+                if not first_section:
+                    parts.append("\n")
+                parts.append(f"### {section}\n\n")
+                section = None
+                first_section = False
+            parts.append(f"- {_REPORT_MARKERS[kind]} {message}\n")
         
         # Add issues found
         if self.issues_found:
-            report += "\n## Issues Found\n\n"
+            parts.append("\n## Issues Found\n\n")
             for issue in self.issues_found:
-                report += f"- ❌ {issue}\n"
+                parts.append(f"- ❌ {issue}\n")
         
         # Add fixes applied
         if self.test_results["fixes_applied"]:
-            report += "\n## Fixes Applied\n\n"
+            parts.append("\n## Fixes Applied\n\n")
             for fix in self.test_results["fixes_applied"]:
-                report += f"- ✅ {fix}\n"
+                parts.append(f"- ✅ {fix}\n")
         
         # Add recommendations
-        report += "\n## Recommendations\n\n"
+        parts.append("\n## Recommendations\n\n")
         
         if status == "PASSED":
-            report += """The Intel deployment script has passed all validation tests and is ready for production use.
+            parts.append("""The Intel deployment script has passed all validation tests and is ready for production use.
 
 ### Key Validations Confirmed:
 - ✅ No syntax errors detected
@@ -565,58 +804,60 @@ Status: **{status}**
 
 ### Production Readiness:
 The script is **READY** for deployment on Intel Core Ultra systems.
-"""
+""")
         elif status == "PASSED_WITH_WARNINGS":
-            report += """The Intel deployment script is functional but has minor issues that should be addressed.
+            parts.append("""The Intel deployment script is functional but has minor issues that should be addressed.
 
 ### Action Items:
-"""
-            for detail in self.test_results["details"]:
-                if "[WARN]" in detail:
-                    report += f"- ⚠️ Review: {detail.replace('[WARN] ', '')}\n"
+""")
+            for message in self._by_kind['WARN']:
+                parts.append(f"- ⚠️ Review: {message}\n")
             
-            report += "\n### Production Readiness:\nThe script is **READY** for deployment with minor caveats."
+            parts.append("\n### Production Readiness:\nThe script is **READY** for deployment with minor caveats.")
         else:
-            report += """The Intel deployment script has critical issues that must be resolved.
+            parts.append("""The Intel deployment script has critical issues that must be resolved.
 
 ### Critical Issues:
-"""
+""")
             for issue in self.issues_found:
-                report += f"- ❌ {issue}\n"
+                parts.append(f"- ❌ {issue}\n")
             
-            report += "\n### Production Readiness:\nThe script **REQUIRES FIXES** before deployment."
+            parts.append("\n### Production Readiness:\nThe script **REQUIRES FIXES** before deployment.")
         
         # Add validation metrics
-        report += f"""
+        content = self.read_script()
+        details = "\n".join(self.test_results["details"])
+        parts.append(f"""
 
 ## Validation Metrics
 
 | Check | Result |
 |-------|--------|
-| Syntax Errors | {"✅ None" if "[FAIL] Found" not in str(self.test_results["details"]) else "❌ Found"} |
-| Try/Catch Blocks | {"✅ Balanced" if "All" in str(self.test_results["details"]) and "try blocks have" in str(self.test_results["details"]) else "⚠️ Check"} |
-| DirectML References | {"✅ 37+" if "DirectML references found: 3" in str(self.test_results["details"]) or "DirectML references found: 4" in str(self.test_results["details"]) else "⚠️ Check"} |
-| AVX-512 Support | {"✅ Yes" if "AVX-512" in str(self.test_results["details"]) else "⚠️ Check"} |
-| Intel MKL | {"✅ Yes" if "Intel MKL" in str(self.test_results["details"]) else "⚠️ Check"} |
-| FP16 Models | {"✅ Yes" if "FP16" in str(self.test_results["details"]) else "⚠️ Check"} |
-| Performance Target | {"✅ 35-45s" if "35-45 seconds" in str(self.test_results["details"]) else "⚠️ Check"} |
+| Syntax Errors | {"✅ None" if "[FAIL] Found" not in details else "❌ Found"} |
+| Try/Catch Blocks | {"✅ Balanced" if "All" in details and "try blocks have" in details else "⚠️ Check"} |
+| DirectML References | {"✅ 37+" if "DirectML references found: 3" in details or "DirectML references found: 4" in details else "⚠️ Check"} |
+| AVX-512 Support | {"✅ Yes" if "AVX-512" in details else "⚠️ Check"} |
+| Intel MKL | {"✅ Yes" if "Intel MKL" in details else "⚠️ Check"} |
+| FP16 Models | {"✅ Yes" if "FP16" in details else "⚠️ Check"} |
+| Performance Target | {"✅ 35-45s" if "35-45 seconds" in details else "⚠️ Check"} |
 
 ## Test Execution Log
 
 Test completed at: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 Script tested: `deployment/prepare_intel.ps1`
-Script size: {len(self.read_script())} bytes
-Total lines: {len(self.read_script().splitlines())}
+Script size: {len(content)} bytes
+Total lines: {len(content.splitlines())}
 
 ---
 *This report was generated by the Intel Deployment Script Testing Suite*
-"""
+""")
         
         # Save report
-        report_path.write_text(report)
+        report = "".join(parts)
+        report_path.write_bytes(report.encode('utf-8'))
         print(f"\n📄 Detailed report saved to: {report_path}")
         
-        return report
+        return report, exit_code
 
 def main():
     """Main test execution"""
@@ -641,20 +882,11 @@ def main():
         tester.test_specific_issues
     ]
     
-    for test in tests:
-        try:
-            test()
-        except Exception as e:
-            print(f"❌ Test failed with exception: {e}")
-    
-    # Generate final report
-    report = tester.generate_report()
+    tester.run_tests(tests)
     
-    # Exit with appropriate code
-    if tester.test_results["failed"] == 0:
-        exit(0)
-    else:
-        exit(1)
+    # Generate final report and exit with its status
+    report, exit_code = tester.generate_report()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
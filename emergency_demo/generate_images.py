@@ -5,36 +5,60 @@ Creates placeholder images for the "futuristic retail store" prompt
 """
 
 import os
+import functools
+import multiprocessing
 from PIL import Image, ImageDraw, ImageFont
 import random
 
+# Pillow's bundled font, loaded once rather than per image
+DEFAULT_FONT = ImageFont.load_default()
+
+@functools.lru_cache(maxsize=None)
+def create_gradient(platform, width, height):
+    """Create the vertical gradient background for a platform (cached; copy before drawing)"""
+    # Different color schemes for different platforms
+    if platform.lower() == 'snapdragon':
+        # Red-orange gradient for Snapdragon
+        start, end = (196, 30, 58), (255, 107, 107)
+    else:  # Intel
+        # Blue gradient for Intel
+        start, end = (26, 33, 62), (102, 153, 255)
+    
+    # Build a one-pixel-wide column, then let Pillow stretch it across the width
+    column = bytearray()
+    for y in range(height):
+        for lo, hi in zip(start, end):
+            column.append(int(lo + (hi - lo) * (y / height)))
+    
+    return Image.frombytes('RGB', (1, height), bytes(column)).resize(
+        (width, height), Image.NEAREST)
+
+def draw_centered_text(draw, y, text, width, font):
+    """Draw white text horizontally centered in an image of the given width"""
+    if isinstance(font, ImageFont.FreeTypeFont):
+        # Anchor 'ma' centers on x, with y at the ascender line as for
+        # regular top-left placement
+        draw.text((width // 2, y), text, fill='white', font=font, anchor='ma')
+    else:
+        # Bitmap fonts (load_default() before Pillow 10.1) ignore anchors
+        text_bbox = draw.textbbox((0, 0), text, font=font)
+        text_width = text_bbox[2] - text_bbox[0]
+        draw.text(((width - text_width) // 2, y), text, fill='white', font=font)
+
 def create_placeholder_image(filename, platform, index, width=512, height=512):
     """Create a placeholder image with text overlay"""
     # Generate a gradient background
-    img = Image.new('RGB', (width, height), color='black')
+    img = create_gradient(platform, width, height).copy()
     draw = ImageDraw.Draw(img)
     
-    # Create gradient effect
-    for y in range(height):
-        # Different color schemes for different platforms
-        if platform.lower() == 'snapdragon':
-            # Red-orange gradient for Snapdragon
-            r = int(196 + (255 - 196) * (y / height))
-            g = int(30 + (107 - 30) * (y / height))
-            b = int(58 + (107 - 58) * (y / height))
-        else:  # Intel
-            # Blue gradient for Intel
-            r = int(26 + (102 - 26) * (y / height))
-            g = int(33 + (153 - 33) * (y / height))
-            b = int(62 + (255 - 62) * (y / height))
-        
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+    # One generator per image, seeded so every run produces the same assets
+    rng = random.Random(f"{platform}-{index}")
     
     # Add some geometric patterns to simulate retail elements
     for i in range(8):
-        x = random.randint(50, width - 50)
-        y = random.randint(50, height - 50)
-        size = random.randint(20, 80)
+        x = rng.randint(50, width - 50)
+        y = rng.randint(50, height - 50)
+        size = rng.randint(20, 80)
         
         # Draw rectangles to simulate store elements
         draw.rectangle([x, y, x + size, y + size//2], 
@@ -42,46 +66,26 @@ def create_placeholder_image(filename, platform, index, width=512, height=512):
     
     # Add circles to simulate lighting
     for i in range(5):
-        x = random.randint(30, width - 30)
-        y = random.randint(30, height - 30)
-        radius = random.randint(10, 30)
+        x = rng.randint(30, width - 30)
+        y = rng.randint(30, height - 30)
+        radius = rng.randint(10, 30)
         draw.ellipse([x-radius, y-radius, x+radius, y+radius], 
                     outline='yellow', width=1)
     
     # Add text overlay
-    try:
-        # Try to use a default font, fall back to basic if not available
-        font = ImageFont.load_default()
-    except:
-        font = None
+    font = DEFAULT_FONT
     
     # Platform branding
-    platform_text = f"{platform.upper()}"
-    text_bbox = draw.textbbox((0, 0), platform_text, font=font)
-    text_width = text_bbox[2] - text_bbox[0]
-    text_height = text_bbox[3] - text_bbox[1]
-    
-    draw.text(((width - text_width) // 2, 20), platform_text, 
-              fill='white', font=font)
+    draw_centered_text(draw, 20, f"{platform.upper()}", width, font)
     
     # Image description
-    desc_text = "Futuristic Retail Store"
-    desc_bbox = draw.textbbox((0, 0), desc_text, font=font)
-    desc_width = desc_bbox[2] - desc_bbox[0]
-    
-    draw.text(((width - desc_width) // 2, height - 60), desc_text, 
-              fill='white', font=font)
+    draw_centered_text(draw, height - 60, "Futuristic Retail Store", width, font)
     
     # Image number
-    num_text = f"Sample #{index + 1}"
-    num_bbox = draw.textbbox((0, 0), num_text, font=font)
-    num_width = num_bbox[2] - num_bbox[0]
-    
-    draw.text(((width - num_width) // 2, height - 40), num_text, 
-              fill='white', font=font)
+    draw_centered_text(draw, height - 40, f"Sample #{index + 1}", width, font)
     
     # Save the image
-    img.save(filename, 'PNG')
+    img.save(filename, 'PNG', compress_level=1)
     print(f"Generated: {filename}")
 
 def main():
@@ -91,15 +95,16 @@ def main():
     
     print("Generating 40 placeholder images for 'futuristic retail store' prompt...")
     
-    # Generate 20 Intel images
-    for i in range(20):
-        filename = os.path.join(assets_dir, f"retail_store_{i:02d}_intel.png")
-        create_placeholder_image(filename, "Intel", i)
+    # 20 Intel and 20 Snapdragon images
+    tasks = [
+        (os.path.join(assets_dir, f"retail_store_{i:02d}_{platform.lower()}.png"), platform, i)
+        for platform in ("Intel", "Snapdragon")
+        for i in range(20)
+    ]
     
-    # Generate 20 Snapdragon images
-    for i in range(20):
-        filename = os.path.join(assets_dir, f"retail_store_{i:02d}_snapdragon.png")
-        create_placeholder_image(filename, "Snapdragon", i)
+    # Images are independent, so render them across all cores
+    with multiprocessing.Pool() as pool:
+        pool.starmap(create_placeholder_image, tasks)
     
     print(f"Successfully generated 40 images in {assets_dir}/")
     print("Images are ready for the standalone demo!")
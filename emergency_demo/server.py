@@ -4,20 +4,52 @@ Standalone Demo - Web Server
 Minimal HTTP server for the AI Image Generation Battle standalone demo
 """
 
+import errno
 import http.server
-import socketserver
 import os
+import socket
 import sys
 import webbrowser
 import threading
 import time
 from urllib.parse import urlparse
 
+# Optional aiohttp static serving (sendfile, keep-alive), enabled with --aiohttp
+try:
+    from aiohttp import web
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Consecutive ports to try when the requested one is taken
+PORT_ATTEMPTS = 16
+
+# bind() errors that mean the port is taken. Windows also reports EACCES
+# for ports held exclusively or reserved by the system.
+PORT_TAKEN_ERRNOS = {errno.EADDRINUSE}
+if sys.platform == 'win32':
+    PORT_TAKEN_ERRNOS.add(errno.EACCES)
+
+class DemoHTTPServer(http.server.ThreadingHTTPServer):
+    """ThreadingHTTPServer that never shares its port with another process.
+    
+    SO_REUSEADDR (on by default) only skips TIME_WAIT on POSIX, but on
+    Windows it lets bind() succeed on a port that is already being listened
+    on, so there the socket is bound with SO_EXCLUSIVEADDRUSE instead.
+    """
+    
+    if sys.platform == 'win32':
+        allow_reuse_address = False
+        
+        def server_bind(self):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            super().server_bind()
+
 class StandaloneDemoServer:
-    def __init__(self, port=8080):
+    def __init__(self, port=8080, use_aiohttp=False):
         self.port = port
+        self.use_aiohttp = use_aiohttp
         self.server = None
-        self.server_thread = None
         
     def start_server(self):
         """Start the web server"""
@@ -25,29 +57,30 @@ class StandaloneDemoServer:
             # Change to the demo directory
             os.chdir(os.path.dirname(os.path.abspath(__file__)))
             
-            # Create server
+            # Create server on the first free port
             handler = http.server.SimpleHTTPRequestHandler
-            self.server = socketserver.TCPServer(("", self.port), handler)
+            for port in range(self.port, self.port + PORT_ATTEMPTS):
+                try:
+                    self.server = DemoHTTPServer(("", port), handler)
+                    break
+                except OSError as e:
+                    if e.errno not in PORT_TAKEN_ERRNOS:
+                        raise
+                    print(f"Port {port} is already in use. Trying port {port + 1}...")
+            else:
+                print(f"No free port in {self.port}-{self.port + PORT_ATTEMPTS - 1}")
+                return False
+            self.port = port
             
             print(f"Standalone Demo Server starting on port {self.port}")
             print(f"Demo URL: http://localhost:{self.port}")
             print("-" * 50)
             
-            # Start server in a separate thread
-            self.server_thread = threading.Thread(target=self.server.serve_forever)
-            self.server_thread.daemon = True
-            self.server_thread.start()
-            
             return True
             
         except OSError as e:
-            if e.errno == 48:  # Address already in use
-                print(f"Port {self.port} is already in use. Trying port {self.port + 1}...")
-                self.port += 1
-                return self.start_server()
-            else:
-                print(f"Error starting server: {e}")
-                return False
+            print(f"Error starting server: {e}")
+            return False
         except Exception as e:
             print(f"Unexpected error: {e}")
             return False
@@ -64,11 +97,21 @@ class StandaloneDemoServer:
             print(f"Could not open browser automatically: {e}")
             print(f"Please manually open: http://localhost:{self.port}")
     
+    def serve_aiohttp(self):
+        """Serve the demo directory with aiohttp on the socket bound by start_server"""
+        async def index(request):
+            return web.FileResponse('index.html')
+        
+        app = web.Application()
+        app.router.add_get('/', index)
+        app.router.add_static('/', os.getcwd())
+        web.run_app(app, sock=self.server.socket, print=None)
+    
     def stop_server(self):
         """Stop the web server"""
+        # Serving happens on the main thread, so it has already returned here
         if self.server:
             print("\nShutting down server...")
-            self.server.shutdown()
             self.server.server_close()
     
     def run(self, open_browser=True):
@@ -96,14 +139,20 @@ class StandaloneDemoServer:
             print("\nPress Ctrl+C to stop the server")
             print("-" * 50)
             
-            # Keep the main thread alive
-            while True:
-                time.sleep(1)
-                
+            # Serve on the main thread until Ctrl+C
+            if self.use_aiohttp and AIOHTTP_AVAILABLE:
+                self.serve_aiohttp()
+            else:
+                if self.use_aiohttp:
+                    print("aiohttp is not installed; serving with http.server instead")
+                self.server.serve_forever()
+            
         except KeyboardInterrupt:
-            self.stop_server()
-            print("\nServer stopped. Thank you for using Standalone Demo!")
-            return True
+            pass
+        
+        self.stop_server()
+        print("\nServer stopped. Thank you for using Standalone Demo!")
+        return True
 
 def main():
     """Main entry point"""
@@ -111,9 +160,13 @@ def main():
     port = 8080
     
     # Check command line arguments
-    if len(sys.argv) > 1:
+    args = sys.argv[1:]
+    use_aiohttp = '--aiohttp' in args
+    if use_aiohttp:
+        args.remove('--aiohttp')
+    if args:
         try:
-            port = int(sys.argv[1])
+            port = int(args[0])
         except ValueError:
             print("Invalid port number. Using default port 8080.")
     
@@ -128,7 +181,7 @@ def main():
         print("Image generation may not work properly.")
     
     # Start the demo server
-    demo_server = StandaloneDemoServer(port)
+    demo_server = StandaloneDemoServer(port, use_aiohttp)
     return demo_server.run()
 
 if __name__ == "__main__":
@@ -7,14 +7,27 @@ between Snapdragon and Intel Windows machines.
 """
 
 import argparse
-import asyncio
 import json
+import queue
 import socket
 import time
 import threading
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple
 import subprocess
 import sys
+from pathlib import Path
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    # Installed on demand when run as a script (see __main__)
+    requests = None
+
+# Discovery results are reused for this long (seconds) on the same subnet
+CLIENT_CACHE_PATH = Path.home() / '.aidemo_clients.json'
+CLIENT_CACHE_TTL = 900
 
 class DemoController:
     def __init__(self):
@@ -22,8 +35,24 @@ class DemoController:
         self.demo_active = False
         self.results = {}
         
-    def discover_clients(self, timeout: int = 10) -> List[Dict[str, Any]]:
-        """Discover Windows demo clients on the network."""
+        # One keep-alive session for all client traffic, so status polling
+        # reuses connections instead of reconnecting on every request
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+        
+        # Fans each command out to all clients in parallel
+        self._command_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='command')
+        
+        # Hedged status requests get their own workers, so a backup request
+        # never queues behind a busy command fan-out
+        self._hedge_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='hedge')
+        
+    def discover_clients(self, timeout: int = 10, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Discover Windows demo clients on the network.
+        
+        Unless refresh is set, clients cached from a discovery on the same
+        subnet within CLIENT_CACHE_TTL are re-checked instead of rescanning.
+        """
         print("🔍 Discovering demo clients on network...")
         
         discovered_clients = []
@@ -47,32 +76,36 @@ class DemoController:
                 print("❌ Could not determine local network range")
                 return []
                 
-            print(f"📡 Scanning network from {local_ip}")
-            
-            # Simple network scan for demo clients
             network_base = '.'.join(local_ip.split('.')[:-1])
             
-            for i in range(1, 255):
-                ip = f"{network_base}.{i}"
-                if ip == local_ip:
-                    continue
-                    
-                try:
-                    # Try to connect to demo client port
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(0.1)
-                    result = sock.connect_ex((ip, 5000))
-                    sock.close()
-                    
-                    if result == 0:
-                        # Found a potential client, verify it's our demo client
-                        client_info = self.get_client_info(ip)
-                        if client_info:
-                            discovered_clients.append(client_info)
-                            print(f"✅ Found demo client: {client_info['platform']} at {ip}")
-                            
-                except Exception:
-                    continue
+            # Clients found recently on this subnet only need re-checking
+            cached_ips = None if refresh else self._load_client_cache(network_base)
+            if cached_ips:
+                print(f"📋 Checking {len(cached_ips)} cached client(s)")
+                discovered_clients = self._verify_clients(cached_ips)
+                if len(discovered_clients) < len(cached_ips):
+                    print("🔄 Cached clients changed, rescanning")
+                    discovered_clients = []
+            
+            if not discovered_clients:
+                print(f"📡 Scanning network from {local_ip}")
+                
+                # Simple network scan for demo clients
+                candidates = [f"{network_base}.{i}" for i in range(1, 255)]
+                candidates = [ip for ip in candidates if ip != local_ip]
+                
+                # Probe the whole /24 concurrently, so the sweep takes about one
+                # connect timeout instead of one per address
+                with ThreadPoolExecutor(max_workers=128) as executor:
+                    open_ips = [
+                        ip for ip, is_open in zip(candidates, executor.map(self._probe_client_port, candidates))
+                        if is_open
+                    ]
+                
+                # Found potential clients, verify they're our demo clients
+                discovered_clients = self._verify_clients(open_ips)
+                if discovered_clients:
+                    self._save_client_cache(network_base, discovered_clients)
                     
         except Exception as e:
             print(f"❌ Network discovery error: {e}")
@@ -80,11 +113,55 @@ class DemoController:
         self.clients = discovered_clients
         return discovered_clients
     
+    def _verify_clients(self, ips: List[str]) -> List[Dict[str, Any]]:
+        """Fetch /info from each IP concurrently, keeping the demo clients."""
+        if not ips:
+            return []
+        
+        clients = []
+        with ThreadPoolExecutor(max_workers=min(len(ips), 32)) as executor:
+            for ip, client_info in zip(ips, executor.map(self.get_client_info, ips)):
+                if client_info:
+                    clients.append(client_info)
+                    print(f"✅ Found demo client: {client_info['platform']} at {ip}")
+        return clients
+    
+    def _load_client_cache(self, subnet: str) -> Optional[List[str]]:
+        """Return cached client IPs for subnet, if the cache is still fresh."""
+        try:
+            cache = json.loads(CLIENT_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return None
+        
+        if cache.get('subnet') != subnet or time.time() - cache.get('timestamp', 0) >= CLIENT_CACHE_TTL:
+            return None
+        return cache.get('clients') or None
+    
+    def _save_client_cache(self, subnet: str, clients: List[Dict[str, Any]]):
+        """Remember discovered client IPs for the next run."""
+        cache = {
+            'subnet': subnet,
+            'timestamp': time.time(),
+            'clients': [client['ip'] for client in clients]
+        }
+        try:
+            CLIENT_CACHE_PATH.write_text(json.dumps(cache))
+        except OSError as e:
+            print(f"⚠️ Could not save client cache: {e}")
+    
+    def _probe_client_port(self, ip: str) -> bool:
+        """Check whether anything accepts connections on the demo client port."""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(0.3)
+                return sock.connect_ex((ip, 5000)) == 0
+        except OSError:
+            return False
+    
     def get_client_info(self, ip: str) -> Optional[Dict[str, Any]]:
         """Get information about a demo client."""
         try:
-            import requests
-            response = requests.get(f"http://{ip}:5000/info", timeout=2)
+            response = self.session.get(f"http://{ip}:5000/info", timeout=(0.5, 2))
             if response.status_code == 200:
                 info = response.json()
                 info['ip'] = ip
@@ -99,36 +176,39 @@ class DemoController:
             print("❌ No clients available. Run discovery first.")
             return {}
             
+        payload = {
+            'command': command,
+            'data': data or {},
+            'timestamp': time.time()
+        }
+        
+        # Post to every client at once; report in client order
         results = {}
+        replies = self._command_pool.map(lambda client: self._post_command(client, payload), self.clients)
         
-        for client in self.clients:
-            try:
-                import requests
-                payload = {
-                    'command': command,
-                    'data': data or {},
-                    'timestamp': time.time()
-                }
-                
-                response = requests.post(
-                    f"http://{client['ip']}:5000/command",
-                    json=payload,
-                    timeout=5
-                )
-                
-                if response.status_code == 200:
-                    results[client['platform']] = response.json()
-                    print(f"✅ Command sent to {client['platform']}: {command}")
-                else:
-                    print(f"❌ Failed to send command to {client['platform']}")
-                    results[client['platform']] = {'error': 'Command failed'}
-                    
-            except Exception as e:
-                print(f"❌ Error sending command to {client['platform']}: {e}")
-                results[client['platform']] = {'error': str(e)}
+        for client, (result, message) in zip(self.clients, replies):
+            print(message)
+            results[client['platform']] = result
                 
         return results
     
+    def _post_command(self, client: Dict[str, Any], payload: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """Post one command to a client, returning (result, status message)."""
+        try:
+            response = self.session.post(
+                f"http://{client['ip']}:5000/command",
+                json=payload,
+                timeout=(0.5, 5)
+            )
+            
+            if response.status_code == 200:
+                return response.json(), f"✅ Command sent to {client['platform']}: {payload['command']}"
+            else:
+                return {'error': 'Command failed'}, f"❌ Failed to send command to {client['platform']}"
+                
+        except Exception as e:
+            return {'error': str(e)}, f"❌ Error sending command to {client['platform']}: {e}"
+    
     def start_demo(self, prompt: str, steps: int = 20) -> bool:
         """Start synchronized image generation demo."""
         if self.demo_active:
@@ -170,10 +250,28 @@ class DemoController:
         
         start_time = time.time()
         
+        # Each client pushes status over its /events stream; a reader thread
+        # per client feeds them into one queue
+        updates = queue.Queue()
+        stop = threading.Event()
+        for client in self.clients:
+            threading.Thread(
+                target=self._stream_status, args=(client, updates, stop), daemon=True
+            ).start()
+        
+        platforms = {client['platform'] for client in self.clients}
+        status_results = {}
         while self.demo_active:
             try:
-                # Get status from all clients
-                status_results = self.send_command('get_status')
+                # Wait for the next update, then take any others already queued
+                try:
+                    platform, status = updates.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+                status_results[platform] = status
+                while not updates.empty():
+                    platform, status = updates.get_nowait()
+                    status_results[platform] = status
                 
                 # Display progress
                 print("\r" + " "*80, end="")  # Clear line
@@ -193,8 +291,8 @@ class DemoController:
                 
                 print(f"\r{' | '.join(progress_info)}", end="", flush=True)
                 
-                # Check if all completed
-                all_completed = all(
+                # Check if all completed, once every client has reported
+                all_completed = status_results.keys() >= platforms and all(
                     result.get('completed', False) for result in status_results.values()
                     if 'error' not in result
                 )
@@ -203,8 +301,6 @@ class DemoController:
                     self.demo_active = False
                     self.display_final_results(status_results, time.time() - start_time)
                     break
-                    
-                time.sleep(0.5)
                 
             except KeyboardInterrupt:
                 print("\n🛑 Demo interrupted by user")
@@ -213,6 +309,76 @@ class DemoController:
             except Exception as e:
                 print(f"\n❌ Error monitoring demo: {e}")
                 break
+        
+        stop.set()
+    
+    def _stream_status(self, client: Dict[str, Any], updates: queue.Queue, stop: threading.Event):
+        """Feed (platform, status) pairs from a client's /events stream into updates."""
+        platform = client['platform']
+        backoff = 0.5
+        while not stop.is_set():
+            try:
+                with self.session.get(f"http://{client['ip']}:5000/events", stream=True, timeout=(0.5, 5)) as response:
+                    if response.status_code != 200:
+                        break
+                    for line in response.iter_lines():
+                        if stop.is_set():
+                            return
+                        if line.startswith(b'data: '):
+                            updates.put((platform, json.loads(line[6:])))
+                            backoff = 0.5
+                    error = 'Status stream closed'
+            except Exception as e:
+                error = str(e)
+            
+            # Report the gap and reconnect; the next event replaces the error,
+            # so a transient failure doesn't drop the client from the demo
+            updates.put((platform, {'error': error}))
+            stop.wait(backoff)
+            backoff = min(backoff * 2, 4.0)
+        
+        # Client predates /events: poll its status instead, hedging so one
+        # stalled request doesn't hold up the composite display
+        while not stop.is_set():
+            try:
+                response = self.hedged_get(f"http://{client['ip']}:5000/status")
+                if response.status_code == 200:
+                    result = response.json()
+                else:
+                    result = {'error': 'Status request failed'}
+            except Exception as e:
+                result = {'error': str(e)}
+            updates.put((platform, result))
+            stop.wait(0.5)
+    
+    def hedged_get(self, url: str, hedge_after: float = 0.2, timeout: float = 2.0):
+        """GET url, firing a backup request if the first hasn't answered within
+        hedge_after seconds; the first successful response wins.
+        
+        A losing request that is already in flight can't be aborted and simply
+        finishes in the background.
+        """
+        request = lambda: self.session.get(url, timeout=(0.5, timeout))
+        futures = [self._hedge_pool.submit(request)]
+        try:
+            return futures[0].result(timeout=hedge_after)
+        except Exception:
+            if futures[0].done():
+                # Failed outright, or answered just after the wait timed out
+                return futures[0].result()
+        
+        futures.append(self._hedge_pool.submit(request))
+        error = None
+        for future in as_completed(futures):
+            try:
+                response = future.result()
+            except Exception as e:
+                error = e
+                continue
+            for other in futures:
+                other.cancel()
+            return response
+        raise error
     
     def display_final_results(self, results: Dict[str, Any], total_time: float):
         """Display final demo results."""
@@ -265,10 +431,18 @@ class DemoController:
         print("\n📊 CLIENT STATUS:")
         print("-" * 40)
         
-        for client in self.clients:
+        # Query every client at once, then report in client order
+        def fetch_status(client):
             try:
-                import requests
-                response = requests.get(f"http://{client['ip']}:5000/status", timeout=2)
+                return self.session.get(f"http://{client['ip']}:5000/status", timeout=(0.5, 2))
+            except Exception as e:
+                return e
+        
+        responses = self._command_pool.map(fetch_status, self.clients)
+        for client, response in zip(self.clients, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
                 if response.status_code == 200:
                     status = response.json()
                     print(f"✅ {client['platform'].upper()} ({client['ip']}):")
@@ -292,7 +466,7 @@ class DemoController:
                 if command == 'quit' or command == 'exit':
                     break
                 elif command == 'discover':
-                    self.discover_clients()
+                    self.discover_clients(refresh=True)
                 elif command == 'status':
                     self.get_client_status()
                 elif command.startswith('start '):
@@ -326,6 +500,7 @@ def main():
     parser.add_argument('--steps', '-s', type=int, default=20, help='Number of generation steps')
     parser.add_argument('--discover', '-d', action='store_true', help='Discover clients and exit')
     parser.add_argument('--interactive', '-i', action='store_true', help='Run in interactive mode')
+    parser.add_argument('--refresh', action='store_true', help='Rescan the network instead of using cached clients')
     
     args = parser.parse_args()
     
@@ -335,7 +510,7 @@ def main():
     print("=====================================")
     
     # Discover clients
-    clients = controller.discover_clients()
+    clients = controller.discover_clients(refresh=args.refresh)
     
     if not clients:
         print("❌ No demo clients found on network")
@@ -361,11 +536,10 @@ def main():
 
 if __name__ == "__main__":
     # Install required packages if not available
-    try:
-        import requests
-    except ImportError:
+    if requests is None:
         print("Installing required packages...")
         subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'requests'])
         import requests
+        from requests.adapters import HTTPAdapter
     
     sys.exit(main())
\ No newline at end of file
@@ -6,11 +6,75 @@ This script tests the demo system components locally without requiring
 actual Windows machines.
 """
 
+import argparse
+import importlib
+import io
+import os
+import posixpath
+import sys
 import time
 import threading
 import json
+from concurrent.futures import ThreadPoolExecutor
 from demo_control import DemoController
 
+# Make the windows-client modules importable once, not on every test run
+WINDOWS_CLIENT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'windows-client')
+if WINDOWS_CLIENT_DIR not in sys.path:
+    sys.path.insert(0, WINDOWS_CLIENT_DIR)
+
+class OrderedStdout:
+    """Stdout proxy that lets concurrently running tests print in declared order.
+    
+    The earliest unfinished test writes straight through, so its live
+    progress shows as it happens; later tests are buffered until every test
+    before them has finished. Writes go through one print lock so lines from
+    different threads never interleave.
+    """
+    
+    def __init__(self, stream, count: int):
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._buffers = [io.StringIO() for _ in range(count)]
+        self._finished = [False] * count
+        self._head = 0
+        
+    def __getattr__(self, name):
+        # encoding, isatty(), fileno() and the rest come from the real stream
+        return getattr(self.stream, name)
+        
+    def write(self, text):
+        slot = getattr(self._local, 'slot', None)
+        with self._lock:
+            if slot is None or slot == self._head:
+                return self.stream.write(text)
+            return self._buffers[slot].write(text)
+    
+    def flush(self):
+        with self._lock:
+            self.stream.flush()
+    
+    def run(self, slot: int, name: str, func) -> bool:
+        """Run test func as test number slot, returning whether it passed."""
+        self._local.slot = slot
+        try:
+            return bool(func())
+        except Exception as e:
+            print(f"\n❌ {name} failed with error: {e}")
+            return False
+        finally:
+            self._local.slot = None
+            with self._lock:
+                # Hand the terminal to the next unfinished test, releasing
+                # whatever it and any already finished tests have buffered
+                self._finished[slot] = True
+                while self._head < len(self._finished) and self._finished[self._head]:
+                    self._head += 1
+                    if self._head < len(self._buffers):
+                        self.stream.write(self._buffers[self._head].getvalue())
+                self.stream.flush()
+
 class MockClient:
     """Mock demo client for testing."""
     
@@ -18,20 +82,27 @@ class MockClient:
         self.platform_type = platform_type
         self.ip = ip
         self.demo_active = False
-        self.current_step = 0
         self.total_steps = 20
-        self.start_time = None
+        # Different speeds for different platforms
+        self._step_delay = 0.4 if platform_type == 'snapdragon' else 0.6
+        self._start_mono = None
+        self._end_mono = None
+        self.done_event = threading.Event()
         
-    def get_info(self):
-        """Mock client info."""
-        return {
-            'platform': self.platform_type,
-            'processor': f'{"Snapdragon X Elite" if self.platform_type == "snapdragon" else "Intel Core Ultra 7"}',
-            'architecture': 'ARM64' if self.platform_type == 'snapdragon' else 'x86_64',
-            'ai_acceleration': 'NPU' if self.platform_type == 'snapdragon' else 'CPU+iGPU',
+        # Client info never changes, so build it once
+        is_snapdragon = platform_type == 'snapdragon'
+        self._info = {
+            'platform': platform_type,
+            'processor': 'Snapdragon X Elite' if is_snapdragon else 'Intel Core Ultra 7',
+            'architecture': 'ARM64' if is_snapdragon else 'x86_64',
+            'ai_acceleration': 'NPU' if is_snapdragon else 'CPU+iGPU',
             'status': 'ready',
-            'ip': self.ip
+            'ip': ip
         }
+        
+    def get_info(self):
+        """Mock client info."""
+        return self._info
     
     def start_generation(self, prompt: str, steps: int = 20):
         """Start mock generation."""
@@ -39,9 +110,10 @@ class MockClient:
             return False
             
         self.demo_active = True
-        self.current_step = 0
         self.total_steps = steps
-        self.start_time = time.time()
+        self._start_mono = time.monotonic()
+        self._end_mono = None
+        self.done_event.clear()
         
         # Run generation in background
         threading.Thread(target=self._run_generation, daemon=True).start()
@@ -49,38 +121,39 @@ class MockClient:
     
     def _run_generation(self):
         """Run mock generation."""
-        # Different speeds for different platforms
-        step_delay = 0.4 if self.platform_type == 'snapdragon' else 0.6
-        
-        for step in range(1, self.total_steps + 1):
-            if not self.demo_active:
-                break
-            self.current_step = step
-            time.sleep(step_delay)
+        # Sleep until the run deadline; get_status derives the current step
+        end = self._start_mono + self.total_steps * self._step_delay
+        while self.demo_active and time.monotonic() < end:
+            time.sleep(max(0, min(0.2, end - time.monotonic())))
         
-        # Mark complete
+        # Mark complete and wake up anyone waiting on this client
         if self.demo_active:
             time.sleep(0.1)  # Small delay to ensure completion
+        self._end_mono = time.monotonic()
+        self.demo_active = False
+        self.done_event.set()
     
     def get_status(self):
         """Get mock status."""
+        # Derive everything from one snapshot so no locking is needed
+        # against _run_generation
+        now = time.monotonic()
+        demo_active = self.demo_active
         elapsed_time = 0
         completed = False
+        current_step = 0
         
-        if self.start_time:
-            elapsed_time = time.time() - self.start_time
+        if self._start_mono:
+            elapsed_time = (self._end_mono or now) - self._start_mono
             # Check if generation should be complete
-            expected_total_time = self.total_steps * (0.4 if self.platform_type == 'snapdragon' else 0.6)
-            completed = elapsed_time >= expected_total_time
-            
-            if completed:
-                self.demo_active = False
+            completed = elapsed_time >= self.total_steps * self._step_delay
+            current_step = min(self.total_steps, int(elapsed_time / self._step_delay))
         
         return {
-            'status': 'active' if self.demo_active else 'idle',
+            'status': 'active' if demo_active else 'idle',
             'ready': True,
             'model_loaded': True,
-            'current_step': self.current_step,
+            'current_step': current_step,
             'total_steps': self.total_steps,
             'elapsed_time': elapsed_time,
             'completed': completed,
@@ -94,7 +167,9 @@ class MockClient:
 class DemoTester:
     """Test the demo system."""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+        self._last_render = ""
         self.mock_clients = {
             'snapdragon': MockClient('snapdragon', '192.168.1.100'),
             'intel': MockClient('intel', '192.168.1.101')
@@ -105,13 +180,9 @@ class DemoTester:
         print("🧪 Testing Platform Detection...")
         
         try:
-            import sys
-            import os
-            # Add the windows-client directory to the Python path
-            sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'windows-client'))
-            
-            from platform_detection import PlatformDetector
-            detector = PlatformDetector()
+            # Cached in sys.modules after the first run
+            platform_detection = importlib.import_module('platform_detection')
+            detector = platform_detection.PlatformDetector()
             
             # This will detect the current macOS system, but the logic should work
             platform_info = detector.detect_hardware()
@@ -127,6 +198,25 @@ class DemoTester:
             
         return True
     
+    def _print_progress(self):
+        """Render a single status line for all mock clients."""
+        status_info = [None] * len(self.mock_clients)
+        
+        for i, (platform, client) in enumerate(self.mock_clients.items()):
+            status = client.get_status()
+            
+            if status['completed']:
+                status_info[i] = "%s: ✅ COMPLETE (%.1fs)" % (platform.upper(), status['elapsed_time'])
+            else:
+                progress = int((status['current_step'] / status['total_steps']) * 100)
+                status_info[i] = "%s: %d%% (%d/%d)" % (platform.upper(), progress, status['current_step'], status['total_steps'])
+        
+        # Only touch the terminal when the line actually changed
+        line = "\r" + " | ".join(status_info)
+        if line != self._last_render:
+            print(line, end="", flush=True)
+            self._last_render = line
+    
     def test_control_system(self):
         """Test the control system with mock clients."""
         print("\n🧪 Testing Control System...")
@@ -148,57 +238,43 @@ class DemoTester:
         
         print(f"✅ Demo started with prompt: '{prompt}'")
         
-        # Monitor progress
+        # Wait for the mock clients to signal completion
         print("\n📊 Monitoring progress...")
-        start_time = time.time()
+        deadline = time.time() + 30  # Timeout after 30 seconds
         
-        while True:
-            # Get status from mock clients
-            status_info = []
-            all_completed = True
-            
-            for platform, client in self.mock_clients.items():
-                status = client.get_status()
-                
-                if not status['completed']:
-                    all_completed = False
-                
-                progress = int((status['current_step'] / status['total_steps']) * 100)
-                elapsed = status['elapsed_time']
-                
-                if status['completed']:
-                    status_info.append(f"{platform.upper()}: ✅ COMPLETE ({elapsed:.1f}s)")
-                else:
-                    status_info.append(f"{platform.upper()}: {progress}% ({status['current_step']}/{status['total_steps']})")
-            
-            # Clear line and show progress
-            print(f"\r{' | '.join(status_info)}", end="", flush=True)
-            
-            if all_completed:
-                break
-                
-            if time.time() - start_time > 30:  # Timeout after 30 seconds
-                print("\n⏰ Test timeout reached")
-                break
-                
-            time.sleep(0.5)
+        for client in self.mock_clients.values():
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                # Only wake up periodically when there is progress to display
+                if client.done_event.wait(timeout=min(remaining, 0.5) if self.verbose else remaining):
+                    break
+                self._print_progress()
+        
+        if self.verbose:
+            self._print_progress()
+        
+        if not all(client.done_event.is_set() for client in self.mock_clients.values()):
+            print("\n⏰ Test timeout reached")
         
         # Show final results
         print("\n\n🏆 Final Results:")
-        results = []
+        winner = None
         for platform, client in self.mock_clients.items():
             status = client.get_status()
             elapsed = status['elapsed_time']
             completed = status['completed']
             
+            # Track the fastest completed client in the same pass
+            if completed and (winner is None or elapsed < winner[1]):
+                winner = (platform, elapsed)
+            
             icon = "✅" if completed else "❌"
-            results.append((platform, elapsed, completed))
             print(f"{icon} {platform.upper()}: {elapsed:.1f}s {'(COMPLETE)' if completed else '(INCOMPLETE)'}")
         
         # Determine winner
-        completed_results = [(platform, elapsed) for platform, elapsed, completed in results if completed]
-        if completed_results:
-            winner = min(completed_results, key=lambda x: x[1])
+        if winner:
             print(f"\n🥇 WINNER: {winner[0].upper()} ({winner[1]:.1f}s)")
             
             # Verify Snapdragon wins (as expected)
@@ -217,8 +293,7 @@ class DemoTester:
         print("\n🧪 Testing File Structure...")
         
         # Get project root directory (parent of control-hub)
-        import os
-        project_root = os.path.dirname(os.path.dirname(__file__))
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         
         required_files = [
             'README.md',
@@ -231,11 +306,27 @@ class DemoTester:
             'deployment/setup_windows.ps1'
         ]
         
+        # Collect every required file in a single walk of the tree, only
+        # descending into directories that lead to something on the list
+        needed_dirs = set()
+        for file_path in required_files:
+            parent = posixpath.dirname(file_path)
+            while parent:
+                needed_dirs.add(parent)
+                parent = posixpath.dirname(parent)
+        
+        found_files = set()
+        for root, dirs, files in os.walk(project_root, topdown=True):
+            rel_root = os.path.relpath(root, project_root).replace(os.sep, '/')
+            if rel_root == '.':
+                rel_root = ''
+            dirs[:] = [d for d in dirs if posixpath.join(rel_root, d) in needed_dirs]
+            found_files.update(posixpath.join(rel_root, name) for name in files)
+        
         missing_files = []
         
         for file_path in required_files:
-            full_path = os.path.join(project_root, file_path)
-            if os.path.exists(full_path):
+            if file_path in found_files:
                 print(f"✅ {file_path}")
             else:
                 print(f"❌ {file_path}")
@@ -259,15 +350,21 @@ class DemoTester:
             ("Control System", self.test_control_system)
         ]
         
-        passed = 0
         total = len(tests)
         
-        for test_name, test_func in tests:
-            try:
-                if test_func():
-                    passed += 1
-            except Exception as e:
-                print(f"\n❌ {test_name} failed with error: {e}")
+        # The tests share no state, so run them side by side; their output
+        # still appears in the order they are declared
+        stdout = OrderedStdout(sys.stdout, total)
+        sys.stdout = stdout
+        try:
+            with ThreadPoolExecutor(max_workers=total) as executor:
+                futures = [
+                    executor.submit(stdout.run, slot, test_name, test_func)
+                    for slot, (test_name, test_func) in enumerate(tests)
+                ]
+                passed = sum(future.result() for future in futures)
+        finally:
+            sys.stdout = stdout.stream
         
         print("\n" + "=" * 50)
         print(f"🧪 TEST RESULTS: {passed}/{total} tests passed")
@@ -281,7 +378,11 @@ class DemoTester:
 
 def main():
     """Main test function."""
-    tester = DemoTester()
+    parser = argparse.ArgumentParser(description="AI Image Generation Demo System Tests")
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show live progress while the mock demo runs')
+    args = parser.parse_args()
+    
+    tester = DemoTester(verbose=args.verbose)
     success = tester.run_all_tests()
     
     if success:
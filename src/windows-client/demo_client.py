@@ -8,25 +8,27 @@ for real-time AI image generation comparison.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import threading
 import time
 import json
 import os
 import sys
 import logging
-from typing import Dict, Any, Optional, Callable
-from datetime import datetime
-import socket
-from flask import Flask, request, jsonify, send_from_directory, render_template_string, send_file
+import atexit
+from logging.handlers import QueueHandler, QueueListener
+import platform
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from typing import Dict, Any, Optional
+from flask import Flask, Response, request, jsonify, send_from_directory, render_template_string
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
-import base64
-from io import BytesIO
 from PIL import Image, ImageTk
 import psutil
 import queue
 import uuid
-import hashlib
 from pathlib import Path
 import requests
 
@@ -43,7 +45,99 @@ except ImportError:
     EMERGENCY_MODE_AVAILABLE = False
     print("Warning: Emergency mode not available - emergency_simulator module not found")
 
+# Faster JSON serialization for the polled status endpoints
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# On Windows read memory straight from GlobalMemoryStatusEx instead of
+# building a psutil namedtuple on every sample
+if platform.system() == 'Windows':
+    import ctypes
+    
+    class _MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [
+            ('dwLength', ctypes.c_ulong),
+            ('dwMemoryLoad', ctypes.c_ulong),
+            ('ullTotalPhys', ctypes.c_ulonglong),
+            ('ullAvailPhys', ctypes.c_ulonglong),
+            ('ullTotalPageFile', ctypes.c_ulonglong),
+            ('ullAvailPageFile', ctypes.c_ulonglong),
+            ('ullTotalVirtual', ctypes.c_ulonglong),
+            ('ullAvailVirtual', ctypes.c_ulonglong),
+            ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+        ]
+    
+    _MEM_STATUS = _MEMORYSTATUSEX()
+    _MEM_STATUS.dwLength = ctypes.sizeof(_MEMORYSTATUSEX)
+    
+    def _mem_used_gb() -> float:
+        if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(_MEM_STATUS)):
+            return psutil.virtual_memory().used / (1024**3)
+        return (_MEM_STATUS.ullTotalPhys - _MEM_STATUS.ullAvailPhys) / (1024**3)
+else:
+    def _mem_used_gb() -> float:
+        return psutil.virtual_memory().used / (1024**3)
+
+class _SysCache:
+    """Samples system CPU, memory and health on a single background thread.
+    
+    The monitor loop, /status and Socket.IO pushes all read the cached values,
+    so the psutil syscall rate stays fixed however many consumers there are.
+    Sampling begins with the first start() call.
+    """
+    
+    # The health summary also stats the disk and model paths, so it is only
+    # refreshed every HEALTH_EVERY samples
+    HEALTH_EVERY = 10
+    
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.cpu = 0.0
+        self.mem_gb = 0.0
+        self.health = None
+        self._health_source = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+        
+    def start(self, health_source=None):
+        """Start the sampler thread if it isn't running yet.
+        
+        When given, health_source() is called to refresh self.health.
+        """
+        with self._start_lock:
+            if health_source is not None:
+                self._health_source = health_source
+            if self._thread is not None:
+                return
+            
+            # Prime psutil so later non-blocking cpu_percent() calls return a delta
+            psutil.cpu_percent(interval=None)
+            
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        
+    def _run(self):
+        samples = 0
+        while True:
+            try:
+                self.cpu = psutil.cpu_percent(interval=None)
+                self.mem_gb = _mem_used_gb()
+                if self._health_source is not None and (self.health is None or samples % self.HEALTH_EVERY == 0):
+                    self.health = self._health_source()
+            except Exception as e:
+                logging.error(f"Error sampling system metrics: {e}")
+            samples += 1
+            time.sleep(self.interval)
+
+_SYS_CACHE = _SysCache()
+
 class DemoDisplay:
+    # Redraw rate the UI tick aims for, whatever the cost of each redraw
+    TARGET_FPS = 10
+    
     def __init__(self, platform_info: Dict[str, Any]):
         self.platform_info = platform_info
         self.is_snapdragon = platform_info['platform_type'] == 'snapdragon'
@@ -84,9 +178,93 @@ class DemoDisplay:
         self.power_consumption = 0
         self.npu_usage = 0 if self.is_snapdragon else None
         
+        # Displayed CPU utilization is this process's share of all cores;
+        # the power model keeps using system-wide load (_sys_cpu)
+        self._sys_cpu = 0
+        self._proc = psutil.Process(os.getpid())
+        self._proc.cpu_percent(None)  # Prime so later calls return a delta
+        self._cpu_count = psutil.cpu_count() or 1
+        
+        # System metrics and the health summary come from the shared sampler
+        _SYS_CACHE.start(self.error_mitigation.get_health_summary)
+        
+        # Platform-dependent colors and labels, resolved once (fonts are
+        # added in setup_ui because they need a Tk root)
+        if self.is_snapdragon:
+            self._theme = {
+                'bg': '#1a1a2e',
+                'brand': '#c41e3a',
+                'accent': '#00ff88',
+                'accent_active': '#00cc66',
+                'prompt_title': '#ff6b6b',
+                'perf_title': '#ff99cc',
+                'logo_text': "🔥 Snapdragon X Elite",
+                'ai_label': "NPU UTILIZATION",
+                'progress_title': "🎯 GENERATION PROGRESS",
+                'processing_with': 'NPU',
+                'powered_by': 'Snapdragon NPU'
+            }
+        else:
+            self._theme = {
+                'bg': '#1e3c72',
+                'brand': '#0071c5',
+                'accent': '#ffa500',
+                'accent_active': '#cc8500',
+                'prompt_title': '#00a8ff',
+                'perf_title': '#66ccff',
+                'logo_text': "⚡ Intel Core Ultra 7",
+                'ai_label': "CPU UTILIZATION",
+                'progress_title': "⚙️ GENERATION PROGRESS",
+                'processing_with': 'CPU + iGPU',
+                'powered_by': 'Intel DirectML'
+            }
+        
+        # Platform power model, chosen once instead of branching every sample
+        self._compute_power = self._power_snapdragon if self.is_snapdragon else self._power_intel
+        
+        # Status payload template with the keys pre-laid out; get_status()
+        # fills in a fresh shallow copy so callers never share a dict
+        self._status = {
+            'status': 'idle',
+            'ready': False,
+            'model_loaded': False,
+            'llm_ready': False,
+            'control_reachable': False,
+            'current_step': 0,
+            'total_steps': self.total_steps,
+            'elapsed_time': 0,
+            'completed': False,
+            'prompt': '',
+            'platform': platform_info['platform_type'],
+            'telemetry': {
+                'cpu': 0,
+                'memory_gb': 0,
+                'power_w': 0,
+                'npu': self.npu_usage
+            },
+            'image_url': None,
+            'current_job_id': None,
+            'health': {},
+            'emergency_mode': {}
+        }
+        
         # Setup logging
         self.logger = logging.getLogger(__name__)
         
+        # Display state shared with worker threads: workers post values into
+        # _ui_state_new and _tick redraws only the widgets whose value changed
+        self._ui_state = {}
+        self._ui_state_new = {}
+        self._last_text = {}
+        self._tick_costs = deque(maxlen=100)  # ~10 s of tick durations
+        
+        # Generations run one at a time on a single reused worker thread
+        self._gen_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gen')
+        self._gen_future = None
+        # Bumped on every start and stop; a run only reports progress and
+        # results while it still holds the current token
+        self._gen_token = 0
+        
         # Reference to network server for Socket.IO emits (will be set after server initialization)
         self.server = None  # type: Optional[Any]
         
@@ -127,7 +305,25 @@ class DemoDisplay:
         
         # Make fullscreen
         self.root.attributes('-fullscreen', True)
-        self.root.configure(bg='#1a1a2e' if self.is_snapdragon else '#1e3c72')
+        self.root.configure(bg=self._theme['bg'])
+        
+        # Shared font objects: Tk measures each once instead of per widget
+        self._theme.update({
+            'font_metric': tkfont.Font(family='Segoe UI', size=36, weight='bold'),
+            'font_logo': tkfont.Font(family='Segoe UI', size=28, weight='bold'),
+            'font_status': tkfont.Font(family='Segoe UI', size=24, weight='bold'),
+            'font_title': tkfont.Font(family='Segoe UI', size=16, weight='bold'),
+            'font_overlay': tkfont.Font(family='Segoe UI', size=16),
+            'font_section': tkfont.Font(family='Segoe UI', size=14, weight='bold'),
+            'font_unit': tkfont.Font(family='Segoe UI', size=14),
+            'font_label': tkfont.Font(family='Segoe UI', size=12, weight='bold'),
+            'font_body': tkfont.Font(family='Segoe UI', size=12),
+            'font_button': tkfont.Font(family='Segoe UI', size=11, weight='bold'),
+            'font_small_bold': tkfont.Font(family='Segoe UI', size=10, weight='bold'),
+            'font_prompt': tkfont.Font(family='Segoe UI', size=10, slant='italic'),
+            'font_small': tkfont.Font(family='Segoe UI', size=10),
+            'font_tiny': tkfont.Font(family='Segoe UI', size=9)
+        })
         
         # Allow ESC to exit fullscreen for testing
         self.root.bind('<Escape>', lambda e: self.root.attributes('-fullscreen', False))
@@ -141,6 +337,21 @@ class DemoDisplay:
         self.create_content_area()
         self.create_status_bar()
         
+        # Single periodic redraw for all frequently changing widgets
+        self._ui_renderers = {
+            'status': lambda value: self.status_label.config(text=value[0], fg=value[1]),
+            'ai': lambda value: self.ai_value.config(text=value),
+            'mem': lambda value: self.memory_value.config(text=value),
+            'pwr': lambda value: self.power_value.config(text=value),
+            'time': lambda value: self.time_value.config(text=value),
+            'progress': self.progress_var.set,
+            'progress_text': lambda value: self.progress_text.config(text=value),
+            'image_status': lambda value: self.image_status.config(text=value),
+            'prompt': lambda value: self.prompt_label.config(text=value)
+        }
+        self.root.after(100, self._tick)
+        self.root.after(100, self._sample_perf)
+        
     def create_status_bar(self):
         """Create bottom status bar with environment readiness indicator."""
         self.status_bar = tk.Frame(self.main_frame, bg='#1a1a2e', height=50, relief='raised', bd=1)
@@ -151,7 +362,7 @@ class DemoDisplay:
         self.env_status_label = tk.Label(
             self.status_bar,
             text="🟡 Checking Environment...",
-            font=('Segoe UI', 14, 'bold'),
+            font=self._theme['font_section'],
             fg='#ffa500',
             bg='#1a1a2e'
         )
@@ -161,7 +372,7 @@ class DemoDisplay:
         self.system_info_label = tk.Label(
             self.status_bar,
             text=f"Intel Core Ultra | DirectML Ready | Models: Loading...",
-            font=('Segoe UI', 10),
+            font=self._theme['font_small'],
             fg='#cccccc',
             bg='#1a1a2e'
         )
@@ -172,18 +383,17 @@ class DemoDisplay:
         
     def create_header(self):
         """Create the header with platform branding and status."""
-        header_color = '#c41e3a' if self.is_snapdragon else '#0071c5'
+        header_color = self._theme['brand']
         
         self.header_frame = tk.Frame(self.main_frame, bg=header_color, height=80)
         self.header_frame.pack(fill=tk.X, pady=(0, 10))
         self.header_frame.pack_propagate(False)
         
         # Platform logo and name
-        logo_text = "🔥 Snapdragon X Elite" if self.is_snapdragon else "⚡ Intel Core Ultra 7"
         self.logo_label = tk.Label(
             self.header_frame,
-            text=logo_text,
-            font=('Segoe UI', 28, 'bold'),
+            text=self._theme['logo_text'],
+            font=self._theme['font_logo'],
             fg='white',
             bg=header_color
         )
@@ -193,7 +403,7 @@ class DemoDisplay:
         self.status_label = tk.Label(
             self.header_frame,
             text="🟡 READY",
-            font=('Segoe UI', 24, 'bold'),
+            font=self._theme['font_status'],
             fg='#ffa500',
             bg=header_color
         )
@@ -216,11 +426,18 @@ class DemoDisplay:
         )
         self.image_canvas.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
+        # Persistent PhotoImage and canvas item, refreshed in place per result
+        self._display_size = (512, 512)
+        self._tk_img = ImageTk.PhotoImage('RGB', self._display_size)
+        self._canvas_img_id = self.image_canvas.create_image(
+            0, 0, image=self._tk_img, anchor='center', state='hidden'
+        )
+        
         # Image status overlay
         self.image_status = tk.Label(
             self.image_canvas,
             text="Waiting for demo to start...",
-            font=('Segoe UI', 16),
+            font=self._theme['font_overlay'],
             fg='white',
             bg='#1a1a1a'
         )
@@ -235,7 +452,7 @@ class DemoDisplay:
     def create_metrics_widgets(self):
         """Create metrics display widgets."""
         metric_bg = '#2a2a3e'
-        border_color = '#c41e3a' if self.is_snapdragon else '#0071c5'
+        accent = self._theme['accent']
         
         # Generation Time
         self.time_frame = tk.Frame(self.metrics_frame, bg=metric_bg, relief='raised', bd=2)
@@ -244,7 +461,7 @@ class DemoDisplay:
         tk.Label(
             self.time_frame,
             text="GENERATION TIME",
-            font=('Segoe UI', 12, 'bold'),
+            font=self._theme['font_label'],
             fg='#888',
             bg=metric_bg
         ).pack(pady=(15, 5))
@@ -252,8 +469,8 @@ class DemoDisplay:
         self.time_value = tk.Label(
             self.time_frame,
             text="0.0",
-            font=('Segoe UI', 36, 'bold'),
-            fg='#00ff88' if self.is_snapdragon else '#ffa500',
+            font=self._theme['font_metric'],
+            fg=accent,
             bg=metric_bg
         )
         self.time_value.pack()
@@ -261,20 +478,19 @@ class DemoDisplay:
         tk.Label(
             self.time_frame,
             text="seconds",
-            font=('Segoe UI', 14),
+            font=self._theme['font_unit'],
             fg='#ccc',
             bg=metric_bg
         ).pack(pady=(0, 15))
         
         # AI Acceleration Usage
-        ai_label = "NPU UTILIZATION" if self.is_snapdragon else "CPU UTILIZATION"
         self.ai_frame = tk.Frame(self.metrics_frame, bg=metric_bg, relief='raised', bd=2)
         self.ai_frame.pack(fill=tk.X, pady=(0, 20))
         
         tk.Label(
             self.ai_frame,
-            text=ai_label,
-            font=('Segoe UI', 12, 'bold'),
+            text=self._theme['ai_label'],
+            font=self._theme['font_label'],
             fg='#888',
             bg=metric_bg
         ).pack(pady=(15, 5))
@@ -282,8 +498,8 @@ class DemoDisplay:
         self.ai_value = tk.Label(
             self.ai_frame,
             text="0",
-            font=('Segoe UI', 36, 'bold'),
-            fg='#00ff88' if self.is_snapdragon else '#ffa500',
+            font=self._theme['font_metric'],
+            fg=accent,
             bg=metric_bg
         )
         self.ai_value.pack()
@@ -291,7 +507,7 @@ class DemoDisplay:
         tk.Label(
             self.ai_frame,
             text="%",
-            font=('Segoe UI', 14),
+            font=self._theme['font_unit'],
             fg='#ccc',
             bg=metric_bg
         ).pack(pady=(0, 15))
@@ -303,7 +519,7 @@ class DemoDisplay:
         tk.Label(
             self.memory_frame,
             text="MEMORY USAGE",
-            font=('Segoe UI', 12, 'bold'),
+            font=self._theme['font_label'],
             fg='#888',
             bg=metric_bg
         ).pack(pady=(15, 5))
@@ -311,8 +527,8 @@ class DemoDisplay:
         self.memory_value = tk.Label(
             self.memory_frame,
             text="0.0",
-            font=('Segoe UI', 36, 'bold'),
-            fg='#00ff88' if self.is_snapdragon else '#ffa500',
+            font=self._theme['font_metric'],
+            fg=accent,
             bg=metric_bg
         )
         self.memory_value.pack()
@@ -320,7 +536,7 @@ class DemoDisplay:
         tk.Label(
             self.memory_frame,
             text="GB",
-            font=('Segoe UI', 14),
+            font=self._theme['font_unit'],
             fg='#ccc',
             bg=metric_bg
         ).pack(pady=(0, 15))
@@ -332,7 +548,7 @@ class DemoDisplay:
         tk.Label(
             self.power_frame,
             text="POWER EFFICIENCY",
-            font=('Segoe UI', 12, 'bold'),
+            font=self._theme['font_label'],
             fg='#888',
             bg=metric_bg
         ).pack(pady=(15, 5))
@@ -340,8 +556,8 @@ class DemoDisplay:
         self.power_value = tk.Label(
             self.power_frame,
             text="0",
-            font=('Segoe UI', 36, 'bold'),
-            fg='#00ff88' if self.is_snapdragon else '#ffa500',
+            font=self._theme['font_metric'],
+            fg=accent,
             bg=metric_bg
         )
         self.power_value.pack()
@@ -349,21 +565,20 @@ class DemoDisplay:
         tk.Label(
             self.power_frame,
             text="W",
-            font=('Segoe UI', 14),
+            font=self._theme['font_unit'],
             fg='#ccc',
             bg=metric_bg
         ).pack(pady=(0, 15))
         
         # Progress Section
-        progress_color = '#00ff88' if self.is_snapdragon else '#ffa500'
         self.progress_frame = tk.Frame(self.metrics_frame, bg=metric_bg, relief='raised', bd=2)
         self.progress_frame.pack(fill=tk.X, pady=(0, 20))
         
         tk.Label(
             self.progress_frame,
-            text="🎯 GENERATION PROGRESS" if self.is_snapdragon else "⚙️ GENERATION PROGRESS",
-            font=('Segoe UI', 14, 'bold'),
-            fg=progress_color,
+            text=self._theme['progress_title'],
+            font=self._theme['font_section'],
+            fg=accent,
             bg=metric_bg
         ).pack(pady=(15, 10))
         
@@ -382,7 +597,7 @@ class DemoDisplay:
         self.progress_text = tk.Label(
             self.progress_frame,
             text="Steps: 0/20 | 0% Complete",
-            font=('Segoe UI', 12),
+            font=self._theme['font_body'],
             fg='white',
             bg=metric_bg
         )
@@ -395,15 +610,15 @@ class DemoDisplay:
         tk.Label(
             self.prompt_frame,
             text="💭 Current Prompt:",
-            font=('Segoe UI', 12, 'bold'),
-            fg='#00a8ff' if not self.is_snapdragon else '#ff6b6b',
+            font=self._theme['font_label'],
+            fg=self._theme['prompt_title'],
             bg='#2a2a4e'
         ).pack(pady=(15, 5))
         
         self.prompt_label = tk.Label(
             self.prompt_frame,
             text="Waiting for prompt...",
-            font=('Segoe UI', 10, 'italic'),
+            font=self._theme['font_prompt'],
             fg='white',
             bg='#2a2a4e',
             wraplength=200,
@@ -418,18 +633,18 @@ class DemoDisplay:
         tk.Label(
             self.test_button_frame,
             text="🧪 LOCAL TESTING",
-            font=('Segoe UI', 12, 'bold'),
-            fg='#00ff88' if self.is_snapdragon else '#ffa500',
+            font=self._theme['font_label'],
+            fg=accent,
             bg='#2a2a3e'
         ).pack(pady=(15, 5))
         
         self.test_button = tk.Button(
             self.test_button_frame,
             text="Test Local Generation",
-            font=('Segoe UI', 11, 'bold'),
-            bg='#00ff88' if self.is_snapdragon else '#ffa500',
+            font=self._theme['font_button'],
+            bg=accent,
             fg='black',
-            activebackground='#00cc66' if self.is_snapdragon else '#cc8500',
+            activebackground=self._theme['accent_active'],
             command=self.open_test_dialog,
             relief='raised',
             bd=2
@@ -443,15 +658,15 @@ class DemoDisplay:
         tk.Label(
             self.perf_frame,
             text="📊 PERFORMANCE",
-            font=('Segoe UI', 12, 'bold'),
-            fg='#66ccff' if not self.is_snapdragon else '#ff99cc',
+            font=self._theme['font_label'],
+            fg=self._theme['perf_title'],
             bg='#2a2a5e'
         ).pack(pady=(15, 5))
         
         self.perf_actual = tk.Label(
             self.perf_frame,
             text="Actual: --",
-            font=('Segoe UI', 10),
+            font=self._theme['font_small'],
             fg='white',
             bg='#2a2a5e'
         )
@@ -460,7 +675,7 @@ class DemoDisplay:
         self.perf_expected = tk.Label(
             self.perf_frame,
             text="Expected: 35-45s",
-            font=('Segoe UI', 10),
+            font=self._theme['font_small'],
             fg='#cccccc',
             bg='#2a2a5e'
         )
@@ -469,16 +684,21 @@ class DemoDisplay:
         self.perf_status = tk.Label(
             self.perf_frame,
             text="🟡 Ready to test",
-            font=('Segoe UI', 10, 'bold'),
+            font=self._theme['font_small_bold'],
             fg='#ffa500',
             bg='#2a2a5e'
         )
         self.perf_status.pack(pady=(5, 15))
         
     def setup_monitoring(self):
-        """Setup performance monitoring."""
-        self.monitor_thread = threading.Thread(target=self.monitor_performance, daemon=True)
-        self.monitor_thread.start()
+        """Setup performance monitoring.
+        
+        With a Tk window, sampling is driven by root.after from setup_ui; a
+        background thread is only needed in web-only mode.
+        """
+        if self.root is None:
+            self.monitor_thread = threading.Thread(target=self.monitor_performance, daemon=True)
+            self.monitor_thread.start()
         
     def start_control_hub_monitor(self):
         """Start monitoring control hub reachability."""
@@ -502,86 +722,125 @@ class DemoDisplay:
         control_thread.start()
         
     def monitor_performance(self):
-        """Monitor system performance metrics."""
+        """Monitor system performance metrics (web-only mode, no Tk loop)."""
         while True:
             try:
-                # CPU usage
-                self.cpu_usage = psutil.cpu_percent(interval=0.1)
-                
-                # Memory usage
-                memory = psutil.virtual_memory()
-                self.memory_usage = memory.used / (1024**3)  # GB
-                
-                # Approximate power consumption based on platform and usage
-                if self.is_snapdragon:
-                    # Snapdragon X Elite is more power efficient
-                    base_power = 8
-                    load_factor = (self.cpu_usage / 100) * 7
-                    self.power_consumption = base_power + load_factor
-                    self.npu_usage = min(95, self.cpu_usage + 10) if self.demo_active else 0
-                else:
-                    # Intel Core Ultra consumes more power
-                    base_power = 15
-                    load_factor = (self.cpu_usage / 100) * 13
-                    self.power_consumption = base_power + load_factor
-                
-                # Update UI (skip in web-only mode)
-                web_only_mode = os.environ.get('EMERGENCY_MODE', '').lower() in ('true', '1', 'yes')
-                if not web_only_mode and self.root:
-                    self.root.after_idle(self.update_metrics_display)
-                
-                # Emit telemetry and status via WebSocket
-                if hasattr(self, 'server') and self.server:
-                    try:
-                        # Emit telemetry update
-                        self.server.socketio.emit('telemetry', {
-                            'telemetry': {
-                                'cpu': self.cpu_usage,
-                                'memory_gb': self.memory_usage,
-                                'power_w': self.power_consumption,
-                                'npu': self.npu_usage
-                            }
-                        }, broadcast=True)
-                        
-                        # Emit status snapshot
-                        status_payload = self.get_status(self.current_job_id if self.current_job_id else None)
-                        self.server.socketio.emit('status', status_payload, broadcast=True)
-                    except Exception as emit_error:
-                        self.logger.debug(f"Socket emit error: {emit_error}")
-                
-                time.sleep(1)
-                
+                self._sample_metrics()
+                time.sleep(1.0)
             except Exception as e:
                 logging.error(f"Error monitoring performance: {e}")
                 time.sleep(5)
                 
-    def update_metrics_display(self):
-        """Update the metrics display."""
+    def _sample_perf(self):
+        """Take one metrics sample on the Tk thread and re-arm in a second."""
         try:
-            # Skip UI updates in web-only mode
-            web_only_mode = os.environ.get('EMERGENCY_MODE', '').lower() in ('true', '1', 'yes')
-            if web_only_mode or not self.root:
-                return
+            self._sample_metrics()
+        except Exception as e:
+            logging.error(f"Error monitoring performance: {e}")
+        self.root.after(1000, self._sample_perf)
+        
+    def _sample_metrics(self):
+        """Sample performance metrics, post them to the UI and push them to clients."""
+        # System CPU and memory from the shared sampler, plus this
+        # process's own CPU for the displayed utilization
+        self._sys_cpu = _SYS_CACHE.cpu
+        self.memory_usage = _SYS_CACHE.mem_gb
+        self.cpu_usage = self._proc.cpu_percent(None) / self._cpu_count
+        
+        # Approximate power consumption based on platform and usage
+        self._compute_power()
+        
+        # Post new values for the next UI tick
+        self.update_metrics_display()
+        
+        # Emit telemetry and status via WebSocket
+        if hasattr(self, 'server') and self.server:
+            try:
+                # Emit telemetry update
+                self.server.socketio.emit('telemetry', {
+                    'telemetry': {
+                        'cpu': self.cpu_usage,
+                        'memory_gb': self.memory_usage,
+                        'power_w': self.power_consumption,
+                        'npu': self.npu_usage
+                    }
+                }, broadcast=True)
                 
-            # Update AI acceleration metric
-            if self.is_snapdragon and self.npu_usage is not None:
-                self.ai_value.config(text=f"{int(self.npu_usage)}")
-            else:
-                self.ai_value.config(text=f"{int(self.cpu_usage)}")
-            
-            # Update memory
-            self.memory_value.config(text=f"{self.memory_usage:.1f}")
-            
-            # Update power
-            self.power_value.config(text=f"{int(self.power_consumption)}")
+                # Queue status snapshot (coalesced by the server)
+                status_payload = self.get_status(self.current_job_id if self.current_job_id else None)
+                self.server.queue_status(status_payload)
+            except Exception as emit_error:
+                self.logger.debug(f"Socket emit error: {emit_error}")
+                
+    def _power_snapdragon(self):
+        """Derive power and NPU usage from CPU load (Snapdragon X Elite is more power efficient)."""
+        base_power = 8
+        load_factor = (self._sys_cpu / 100) * 7
+        self.power_consumption = base_power + load_factor
+        self.npu_usage = min(95, self._sys_cpu + 10) if self.demo_active else 0
+        
+    def _power_intel(self):
+        """Derive power from CPU load (Intel Core Ultra consumes more power)."""
+        base_power = 15
+        load_factor = (self._sys_cpu / 100) * 13
+        self.power_consumption = base_power + load_factor
+                
+    def update_metrics_display(self):
+        """Post the latest metric values for the next UI tick."""
+        # Update AI acceleration metric
+        if self.is_snapdragon and self.npu_usage is not None:
+            ai_text = '%d' % self.npu_usage
+        else:
+            ai_text = '%d' % self.cpu_usage
+        
+        self._publish(
+            ai=ai_text,
+            mem='%.1f' % self.memory_usage,
+            pwr='%d' % self.power_consumption
+        )
+        
+    def _set_text(self, widget, text: str):
+        """Set a widget's text, skipping the Tk configure call if it is unchanged."""
+        key = id(widget)
+        if self._last_text.get(key) != text:
+            widget.config(text=text)
+            self._last_text[key] = text
             
+    def _publish(self, **values):
+        """Post display values from any thread; they are drawn on the next _tick."""
+        self._ui_state_new.update(values)
+        
+    def _tick(self):
+        """Redraw the widgets whose posted value changed since the last tick."""
+        t0 = time.perf_counter()
+        try:
             # Update generation time if demo is active
             if self.demo_active and self.start_time:
-                elapsed = time.time() - self.start_time
-                self.time_value.config(text=f"{elapsed:.1f}")
-                
+                self._ui_state_new['time'] = '%.1f' % (time.time() - self.start_time)
+            
+            # Work out every change first, then apply them back-to-back and
+            # let Tk recompute geometry once for the whole batch
+            changed = [
+                (key, value) for key, value in self._ui_state_new.copy().items()
+                if self._ui_state.get(key) != value
+            ]
+            
+            if changed:
+                for key, value in changed:
+                    self._ui_state[key] = value
+                    self._ui_renderers[key](value)
+                self.root.update_idletasks()
+                    
         except Exception as e:
             logging.error(f"Error updating metrics: {e}")
+        
+        # Subtract the expected redraw cost from the frame period so ticks
+        # keep landing at TARGET_FPS even when Tk is slow to draw
+        self._tick_costs.append(time.perf_counter() - t0)
+        period = 1.0 / self.TARGET_FPS
+        recent = list(self._tick_costs)[-10:]
+        predicted = max(min(statistics.fmean(recent), period - 0.001), 0.0)
+        self.root.after(max(1, int(1000 * (period - predicted))), self._tick)
             
     @with_error_recovery()
     def start_generation(self, prompt: str, steps: int = 20, sync_time: Optional[float] = None, 
@@ -592,6 +851,12 @@ class DemoDisplay:
             self.logger.warning("Generation already in progress")
             return None
         
+        # A stopped run keeps going until its pipeline call returns; queuing
+        # behind it would miss sync_time, so report busy instead
+        if self._gen_future is not None and not self._gen_future.done():
+            self.logger.warning("Previous generation is still finishing")
+            return None
+        
         # Pre-flight health checks
         health = self.error_mitigation.check_system_health()
         if health['issues']:
@@ -636,12 +901,12 @@ class DemoDisplay:
             'total_steps': steps
         }
         
-        # Update UI (skip in web-only mode)
-        web_only_mode = os.environ.get('EMERGENCY_MODE', '').lower() in ('true', '1', 'yes')
-        if not web_only_mode and self.root:
-            self.status_label.config(text="🟠 PROCESSING...", fg='#ffa500')
-            self.prompt_label.config(text=prompt)
-            self.image_status.config(text=f"Generating: {prompt}\nProcessing with {'NPU' if self.is_snapdragon else 'CPU + iGPU'}")
+        # Update UI
+        self._publish(
+            status=("🟠 PROCESSING...", '#ffa500'),
+            prompt=prompt,
+            image_status=f"Generating: {prompt}\nProcessing with {self._theme['processing_with']}"
+        )
         
         # Emit job started event
         if hasattr(self, 'server') and self.server:
@@ -655,37 +920,42 @@ class DemoDisplay:
             except Exception as emit_error:
                 self.logger.debug(f"Socket emit error: {emit_error}")
         
-        # Wait for sync time if specified
-        if sync_time is not None:
-            wait_time = sync_time - time.time()
-            if wait_time > 0:
-                time.sleep(wait_time)
-        
-        # Start generation in separate thread
-        gen_thread = threading.Thread(target=self.run_generation, daemon=True)
-        gen_thread.start()
+        # Run generation on the worker thread; it waits for sync_time itself so
+        # the caller (HTTP handler or Tk event) returns immediately
+        self._gen_token += 1
+        self._gen_future = self._gen_pool.submit(self.run_generation, sync_time, self._gen_token)
         
         return job_id
         
-    def run_generation(self):
+    def run_generation(self, sync_time: Optional[float] = None, token: Optional[int] = None):
         """Run the actual image generation using AI pipeline."""
+        if token is None:
+            token = self._gen_token
+        
+        def is_current():
+            return self.demo_active and token == self._gen_token
+        
         try:
+            # Wait for sync time if specified
+            if sync_time is not None:
+                wait_time = sync_time - time.time()
+                if wait_time > 0:
+                    time.sleep(wait_time)
+                if not is_current():
+                    return
+            
             # Initialize AI pipeline if not already done
             if not hasattr(self, 'ai_generator') or self.ai_generator is None:
-                web_only_mode = os.environ.get('EMERGENCY_MODE', '').lower() in ('true', '1', 'yes')
-                if not web_only_mode and self.root:
-                    self.root.after_idle(lambda: self.status_label.config(text="Loading AI model...", fg='yellow'))
+                self._publish(status=("Loading AI model...", 'yellow'))
                 self.ai_generator = AIImageGenerator(self.platform_info)
             
             # Progress callback for real-time updates
             def progress_callback(progress, current_step, total_steps):
-                if not self.demo_active:
+                if not is_current():
                     return
                 self.current_step = current_step
                 progress_percent = progress * 100
-                web_only_mode = os.environ.get('EMERGENCY_MODE', '').lower() in ('true', '1', 'yes')
-                if not web_only_mode and self.root:
-                    self.root.after_idle(self.update_progress, current_step, progress_percent)
+                self.update_progress(current_step, progress_percent)
                 
                 # Update job record
                 if self.current_job_id and self.current_job_id in self.jobs:
@@ -721,9 +991,7 @@ class DemoDisplay:
             self.total_steps = steps
             
             # Generate the image
-            web_only_mode = os.environ.get('EMERGENCY_MODE', '').lower() in ('true', '1', 'yes')
-            if not web_only_mode and self.root:
-                self.root.after_idle(lambda: self.status_label.config(text="Generating...", fg='yellow'))
+            self._publish(status=("Generating...", 'yellow'))
             
             if self.ai_generator:
                 image, metrics = self.ai_generator.generate_image(
@@ -737,6 +1005,10 @@ class DemoDisplay:
             else:
                 raise RuntimeError("AI generator not initialized")
             
+            # A run that was stopped meanwhile leaves no trace
+            if not is_current():
+                return
+            
             # Store the generated image and metrics
             self.generated_image = image
             self.generation_metrics = metrics
@@ -752,7 +1024,7 @@ class DemoDisplay:
                 self.jobs[self.current_job_id]['metrics'] = metrics
             
             # Generation complete
-            if self.demo_active:
+            if is_current():
                 self.end_time = time.time()
                 web_only_mode = os.environ.get('EMERGENCY_MODE', '').lower() in ('true', '1', 'yes')
                 if not web_only_mode and self.root:
@@ -762,6 +1034,8 @@ class DemoDisplay:
                 
         except Exception as e:
             logging.error(f"Error in generation: {e}")
+            if token != self._gen_token:
+                return  # Stopped meanwhile; the job is already marked stopped
             if self.current_job_id and self.current_job_id in self.jobs:
                 self.jobs[self.current_job_id]['status'] = 'error'
                 self.jobs[self.current_job_id]['error'] = str(e)
@@ -772,19 +1046,18 @@ class DemoDisplay:
                 self.generation_error(str(e))
             
     def update_progress(self, step: int, progress: float):
-        """Update progress display."""
-        # Skip UI updates in web-only mode
-        web_only_mode = os.environ.get('EMERGENCY_MODE', '').lower() in ('true', '1', 'yes')
-        if web_only_mode or not self.root:
-            return
-            
-        self.progress_var.set(progress)
-        self.progress_text.config(text=f"Steps: {step}/{self.total_steps} | {int(progress)}% Complete")
+        """Post progress values for the next UI tick (safe to call from any thread)."""
+        percent = int(progress)
+        self._publish(
+            progress=progress,
+            progress_text='Steps: %d/%d | %d%% Complete' % (step, self.total_steps, percent)
+        )
         
         # Update image status
         if step < self.total_steps:
-            self.image_status.config(
-                text=f"Generating: {self.current_prompt}\nStep {step}/{self.total_steps} - {int(progress)}% complete"
+            self._publish(
+                image_status='Generating: %s\nStep %d/%d - %d%% complete' % (
+                    self.current_prompt, step, self.total_steps, percent)
             )
         
     def generation_complete(self):
@@ -801,8 +1074,7 @@ class DemoDisplay:
             self.jobs[self.current_job_id]['elapsed_time'] = elapsed_time
         
         # Update status
-        self.status_label.config(text="✅ COMPLETE!", fg='#00ff88')
-        self.time_value.config(text=f"{elapsed_time:.1f}")
+        self._publish(status=("✅ COMPLETE!", '#00ff88'), time=f"{elapsed_time:.1f}")
         
         # Update performance comparison
         self.update_performance_comparison(elapsed_time)
@@ -825,23 +1097,16 @@ class DemoDisplay:
         
         # Display the generated image
         if hasattr(self, 'generated_image') and self.generated_image:
-            # Convert PIL image to PhotoImage for Tkinter
-            # Resize to fit the display area
-            display_size = (512, 512)
-            resized_image = self.generated_image.resize(display_size, Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(resized_image)
+            # Resize to fit the display area and paste into the existing
+            # PhotoImage rather than creating a new one and a new canvas item
+            resized_image = self.generated_image.resize(self._display_size, Image.Resampling.LANCZOS)
+            self._tk_img.paste(resized_image)
             
-            # Clear the image canvas and add the image
-            self.image_canvas.delete("all")
+            # Center the image
             canvas_width = self.image_canvas.winfo_width()
             canvas_height = self.image_canvas.winfo_height()
-            
-            # Center the image
-            x = canvas_width // 2
-            y = canvas_height // 2
-            
-            self.image_canvas.create_image(x, y, image=photo, anchor='center')
-            self.current_photo = photo  # Keep reference to prevent garbage collection
+            self.image_canvas.coords(self._canvas_img_id, canvas_width // 2, canvas_height // 2)
+            self.image_canvas.itemconfig(self._canvas_img_id, state='normal')
         
         # Update image display with metrics
         if hasattr(self, 'generation_metrics') and self.generation_metrics is not None:
@@ -859,8 +1124,8 @@ class DemoDisplay:
         else:
             metrics_text = f"✅ Complete in {elapsed_time:.1f}s"
         
-        self.image_status.config(
-            text=f"🖼️ Generated Image:\n\"{self.current_prompt}\"\n\nAI-generated artwork\npowered by {'Snapdragon NPU' if self.is_snapdragon else 'Intel DirectML'}"
+        self._publish(
+            image_status=f"🖼️ Generated Image:\n\"{self.current_prompt}\"\n\nAI-generated artwork\npowered by {self._theme['powered_by']}"
         )
         
         # Change image background to indicate completion
@@ -869,8 +1134,7 @@ class DemoDisplay:
     def generation_error(self, error: str):
         """Handle generation error."""
         self.demo_active = False
-        self.status_label.config(text="❌ ERROR", fg='red')
-        self.image_status.config(text=f"Generation failed: {error}")
+        self._publish(status=("❌ ERROR", 'red'), image_status=f"Generation failed: {error}")
         
         # Update job record
         if self.current_job_id and self.current_job_id in self.jobs:
@@ -890,8 +1154,8 @@ class DemoDisplay:
     def stop_generation(self):
         """Stop current generation."""
         self.demo_active = False
-        self.status_label.config(text="🛑 STOPPED", fg='#888')
-        self.image_status.config(text="Generation stopped")
+        self._gen_token += 1
+        self._publish(status=("🛑 STOPPED", '#888'), image_status="Generation stopped")
         
         # Update job record
         if self.current_job_id and self.current_job_id in self.jobs:
@@ -935,8 +1199,11 @@ class DemoDisplay:
         if self.current_job_id and self.current_job_id in self.jobs:
             image_url = self.jobs[self.current_job_id].get('image_url')
         
-        # Get health status
-        health_summary = self.error_mitigation.get_health_summary()
+        # Get health status from the sampler, checking directly only until
+        # its first pass has run
+        health_summary = _SYS_CACHE.health
+        if health_summary is None:
+            health_summary = self.error_mitigation.get_health_summary()
         
         # Get emergency mode status
         emergency_status = {}
@@ -947,30 +1214,30 @@ class DemoDisplay:
                 'emergency_mode_available': EMERGENCY_MODE_AVAILABLE,
                 'emergency_mode_active': False
             }
-            
-        return {
-            'status': 'active' if self.demo_active else 'idle',
-            'ready': self.validation_results.get("overall_ready", False) if self.validation_results else False,
-            'model_loaded': self.ai_generator is not None,
-            'llm_ready': self.ai_generator is not None,
-            'control_reachable': self.control_hub_reachable,
-            'current_step': self.current_step,
-            'total_steps': self.total_steps,
-            'elapsed_time': elapsed_time,
-            'completed': not self.demo_active and self.end_time is not None,
-            'prompt': self.current_prompt,
-            'platform': self.platform_info['platform_type'],
-            'telemetry': {
-                'cpu': self.cpu_usage,
-                'memory_gb': self.memory_usage,
-                'power_w': self.power_consumption,
-                'npu': self.npu_usage
-            },
-            'image_url': image_url,
-            'current_job_id': self.current_job_id,
-            'health': health_summary,
-            'emergency_mode': emergency_status
-        }
+        
+        # Fill in a copy of the template; the nested telemetry dict is copied too
+        status = self._status.copy()
+        status['status'] = 'active' if self.demo_active else 'idle'
+        status['ready'] = self.validation_results.get("overall_ready", False) if self.validation_results else False
+        status['model_loaded'] = status['llm_ready'] = self.ai_generator is not None
+        status['control_reachable'] = self.control_hub_reachable
+        status['current_step'] = self.current_step
+        status['total_steps'] = self.total_steps
+        status['elapsed_time'] = elapsed_time
+        status['completed'] = not self.demo_active and self.end_time is not None
+        status['prompt'] = self.current_prompt
+        status['image_url'] = image_url
+        status['current_job_id'] = self.current_job_id
+        status['health'] = health_summary
+        status['emergency_mode'] = emergency_status
+        
+        telemetry = status['telemetry'] = status['telemetry'].copy()
+        telemetry['cpu'] = self.cpu_usage
+        telemetry['memory_gb'] = _SYS_CACHE.mem_gb
+        telemetry['power_w'] = self.power_consumption
+        telemetry['npu'] = self.npu_usage
+        
+        return status
         
     def validate_environment(self):
         """Validate that the environment is ready for demo using comprehensive validator."""
@@ -1035,14 +1302,14 @@ class DemoDisplay:
         if results["overall_ready"]:
             directml_status = results["details"].get("DirectML Availability", {})
             if directml_status.get("status"):
-                self.system_info_label.config(text="Intel Core Ultra | DirectML Active | Environment: Ready")
+                self._set_text(self.system_info_label, "Intel Core Ultra | DirectML Active | Environment: Ready")
             else:
-                self.system_info_label.config(text="Intel Core Ultra | CPU Fallback | Environment: Ready")
+                self._set_text(self.system_info_label, "Intel Core Ultra | CPU Fallback | Environment: Ready")
         else:
             error_count = results.get("error_count", 0)
             warning_count = results.get("warning_count", 0)
             status_text = f"Intel Core Ultra | Issues: {error_count} errors, {warning_count} warnings"
-            self.system_info_label.config(text=status_text)
+            self._set_text(self.system_info_label, status_text)
         
         # Log detailed results
         self.logger.info(f"Environment validation: {results['checks_passed']}/{results['total_checks']} checks passed")
@@ -1056,18 +1323,18 @@ class DemoDisplay:
         # Get performance expectations from validator
         if hasattr(self, 'environment_validator') and self.environment_validator is not None:
             expectations = self.environment_validator.get_performance_expectations()
-            self.perf_expected.config(text=f"Expected: {expectations['expected_time_range']}")
+            self._set_text(self.perf_expected, f"Expected: {expectations['expected_time_range']}")
             
             # Update system info with acceleration details
             accel_type = expectations.get('acceleration', 'Unknown')
-            self.system_info_label.config(text=f"Intel Core Ultra | {accel_type} | Models: Ready")
+            self._set_text(self.system_info_label, f"Intel Core Ultra | {accel_type} | Models: Ready")
         else:
             # Fallback if validator not available
-            self.system_info_label.config(text="Intel Core Ultra | Models: Ready")
+            self._set_text(self.system_info_label, "Intel Core Ultra | Models: Ready")
         
     def update_performance_comparison(self, actual_time):
         """Update performance comparison display."""
-        self.perf_actual.config(text=f"Actual: {actual_time:.1f}s")
+        self._set_text(self.perf_actual, f"Actual: {actual_time:.1f}s")
         
         if actual_time <= 35:
             self.perf_status.config(text="🟢 Excellent!", fg='#00ff88')
@@ -1100,7 +1367,7 @@ class DemoDisplay:
         tk.Label(
             test_window,
             text="🧪 Local Generation Test",
-            font=('Segoe UI', 16, 'bold'),
+            font=self._theme['font_title'],
             fg='#ffa500',
             bg='#2a2a3e'
         ).pack(pady=20)
@@ -1109,7 +1376,7 @@ class DemoDisplay:
         tk.Label(
             test_window,
             text="Enter your prompt:",
-            font=('Segoe UI', 12),
+            font=self._theme['font_body'],
             fg='white',
             bg='#2a2a3e'
         ).pack(pady=(0, 10))
@@ -1118,7 +1385,7 @@ class DemoDisplay:
             test_window,
             height=4,
             width=50,
-            font=('Segoe UI', 10),
+            font=self._theme['font_small'],
             bg='#3a3a4e',
             fg='white',
             insertbackground='white',
@@ -1136,7 +1403,7 @@ class DemoDisplay:
         tk.Label(
             test_window,
             text="Sample prompts:",
-            font=('Segoe UI', 10, 'bold'),
+            font=self._theme['font_small_bold'],
             fg='#cccccc',
             bg='#2a2a3e'
         ).pack(pady=(10, 5))
@@ -1145,7 +1412,7 @@ class DemoDisplay:
             sample_btn = tk.Button(
                 test_window,
                 text=f"{i}. {prompt[:40]}...",
-                font=('Segoe UI', 9),
+                font=self._theme['font_tiny'],
                 bg='#4a4a5e',
                 fg='white',
                 activebackground='#5a5a6e',
@@ -1169,7 +1436,7 @@ class DemoDisplay:
         tk.Button(
             btn_frame,
             text="Generate Image",
-            font=('Segoe UI', 12, 'bold'),
+            font=self._theme['font_label'],
             bg='#00cc66',
             fg='black',
             command=start_test,
@@ -1181,7 +1448,7 @@ class DemoDisplay:
         tk.Button(
             btn_frame,
             text="Cancel",
-            font=('Segoe UI', 12),
+            font=self._theme['font_body'],
             bg='#666',
             fg='white',
             command=test_window.destroy,
@@ -1195,15 +1462,49 @@ class DemoDisplay:
     
     def run(self):
         """Run the demo display."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._gen_pool.shutdown(wait=False)
 
 class NetworkServer:
+    # Status snapshots pushed within this window are coalesced into one emit
+    STATUS_FLUSH_MS = 50
+    # /events checks for progress this often and sends a keep-alive snapshot
+    # at least every EVENTS_HEARTBEAT_S
+    EVENTS_POLL_MS = 100
+    EVENTS_HEARTBEAT_S = 1.0
+    
     def __init__(self, display: DemoDisplay):
         self.display = display
+        self._pending_status = None
+        self._flush_scheduled = False
+        self._status_lock = threading.Lock()
         self.app = Flask(__name__, static_folder='static')
         CORS(self.app)  # Enable CORS for all routes
         self.socketio = SocketIO(self.app, cors_allowed_origins="*", async_mode='eventlet')
         self.logger = logging.getLogger(__name__)  # Initialize logger
+        
+        # /info only describes the platform, so serialize it once up front
+        info = {
+            'platform': display.platform_info['platform_type'],
+            'processor': display.platform_info.get('processor_model', 'Unknown'),
+            'architecture': display.platform_info.get('architecture', 'Unknown'),
+            'ai_acceleration': display.platform_info.get('ai_acceleration', 'Unknown'),
+            'status': 'ready'
+        }
+        if ORJSON_AVAILABLE:
+            self._info_bytes = orjson.dumps(info, default=str)
+        else:
+            self._info_bytes = json.dumps(info, default=str).encode('utf-8')
+        
+        # Remote commands accepted by POST /command
+        self._handlers = {
+            'start_generation': self._h_start,
+            'stop_generation': self._h_stop,
+            'get_status': self._h_status,
+        }
+        
         self.setup_routes()
         self.setup_socket_handlers()
         
@@ -1309,19 +1610,24 @@ class NetworkServer:
         
         @self.app.route('/info', methods=['GET'])
         def get_info():
-            return jsonify({
-                'platform': self.display.platform_info['platform_type'],
-                'processor': self.display.platform_info.get('processor_model', 'Unknown'),
-                'architecture': self.display.platform_info.get('architecture', 'Unknown'),
-                'ai_acceleration': self.display.platform_info.get('ai_acceleration', 'Unknown'),
-                'status': 'ready'
-            })
+            response = Response(self._info_bytes, mimetype='application/json')
+            response.headers['Cache-Control'] = 'public, max-age=3600'
+            return response
             
         @self.app.route('/status', methods=['GET'])
         def get_status():
             """Get status - optionally with job_id query parameter."""
             job_id = request.args.get('job_id')
-            return jsonify(self.display.get_status(job_id))
+            return self._json_response(self.display.get_status(job_id))
+            
+        @self.app.route('/events', methods=['GET'])
+        def status_events():
+            """Stream status snapshots as Server-Sent Events."""
+            return Response(
+                self._status_stream(),
+                mimetype='text/event-stream',
+                headers={'Cache-Control': 'no-cache'}
+            )
             
         @self.app.route('/command', methods=['POST'])
         def handle_command():
@@ -1330,30 +1636,11 @@ class NetworkServer:
                 command = data.get('command')
                 command_data = data.get('data', {})
                 
-                if command == 'start_generation':
-                    prompt = command_data.get('prompt', 'a beautiful landscape')
-                    steps = command_data.get('steps', 20)
-                    sync_time = command_data.get('sync_time')
-                    mode = command_data.get('mode', 'local')
-                    
-                    job_id = self.display.start_generation(prompt, steps, sync_time, mode)
-                    
-                    if job_id:
-                        return jsonify({'success': True, 'job_id': job_id, 'message': 'Generation started'})
-                    else:
-                        return jsonify({'success': False, 'message': 'Already running'}), 400
-                    
-                elif command == 'stop_generation':
-                    self.display.stop_generation()
-                    return jsonify({'success': True, 'message': 'Generation stopped'})
-                    
-                elif command == 'get_status':
-                    job_id = command_data.get('job_id')
-                    return jsonify(self.display.get_status(job_id))
-                    
-                else:
+                handler = self._handlers.get(command)
+                if handler is None:
                     return jsonify({'success': False, 'message': f'Unknown command: {command}'}), 400
-                    
+                return handler(command_data)
+
             except Exception as e:
                 return jsonify({'success': False, 'message': str(e)}), 500
         
@@ -1409,6 +1696,66 @@ class NetworkServer:
             else:
                 return jsonify({'success': False, 'message': 'AI generator not available'}), 400
     
+    def _h_start(self, command_data: Dict[str, Any]):
+        """Handle the start_generation command."""
+        prompt = command_data.get('prompt', 'a beautiful landscape')
+        steps = command_data.get('steps', 20)
+        sync_time = command_data.get('sync_time')
+        mode = command_data.get('mode', 'local')
+        
+        job_id = self.display.start_generation(prompt, steps, sync_time, mode)
+        
+        if job_id:
+            return jsonify({'success': True, 'job_id': job_id, 'message': 'Generation started'})
+        else:
+            return jsonify({'success': False, 'message': 'Already running'}), 400
+    
+    def _h_stop(self, command_data: Dict[str, Any]):
+        """Handle the stop_generation command."""
+        self.display.stop_generation()
+        return jsonify({'success': True, 'message': 'Generation stopped'})
+    
+    def _h_status(self, command_data: Dict[str, Any]):
+        """Handle the get_status command."""
+        job_id = command_data.get('job_id')
+        return self._json_response(self.display.get_status(job_id))
+    
+    def _json_response(self, payload: Dict[str, Any]):
+        """Serialize a JSON response with orjson when available."""
+        if ORJSON_AVAILABLE:
+            return Response(self._dumps(payload), mimetype='application/json')
+        return jsonify(payload)
+    
+    def _dumps(self, payload: Dict[str, Any]) -> bytes:
+        """Serialize a payload to JSON bytes, with orjson when available."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                payload,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        return json.dumps(payload, default=str).encode('utf-8')
+    
+    def _status_stream(self):
+        """Yield an SSE frame whenever generation state moves on.
+        
+        A cheap key of the step/activity fields is checked every
+        EVENTS_POLL_MS; the full status is only built when it changes or
+        the heartbeat is due. Sleeping through socketio keeps the wait
+        cooperative under eventlet.
+        """
+        display = self.display
+        last_key = None
+        last_sent = 0.0
+        while True:
+            key = (display.current_job_id, display.current_step, display.demo_active, display.end_time)
+            now = time.monotonic()
+            if key != last_key or now - last_sent >= self.EVENTS_HEARTBEAT_S:
+                last_key = key
+                last_sent = now
+                yield b'data: ' + self._dumps(display.get_status()) + b'\n\n'
+            self.socketio.sleep(self.EVENTS_POLL_MS / 1000)
+        
     def setup_socket_handlers(self):
         """Setup Socket.IO event handlers."""
         
@@ -1429,21 +1776,57 @@ class NetworkServer:
             """Handle status request from client."""
             emit('status', self.display.get_status())
                 
+    def queue_status(self, payload: Dict[str, Any]):
+        """Queue a status snapshot for broadcast.
+        
+        Snapshots supersede each other, so only the latest one queued within
+        STATUS_FLUSH_MS is sent, as a single 'status' event.
+        """
+        with self._status_lock:
+            self._pending_status = payload
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        # A plain timer thread runs whichever thread queued the snapshot;
+        # a background task started off the server thread's hub never would
+        timer = threading.Timer(self.STATUS_FLUSH_MS / 1000, self._flush_status)
+        timer.daemon = True
+        timer.start()
+        
+    def _flush_status(self):
+        """Emit the latest queued status snapshot once the flush window ends."""
+        with self._status_lock:
+            payload = self._pending_status
+            self._pending_status = None
+            self._flush_scheduled = False
+        
+        if payload is not None:
+            try:
+                self.socketio.emit('status', payload)
+            except Exception as emit_error:
+                self.logger.debug(f"Socket emit error: {emit_error}")
+                
     def run(self, host='0.0.0.0', port=5000):
         """Run the network server."""
         self.socketio.run(self.app, host=host, port=port, debug=False)
 
 def main():
     """Main function."""
-    # Setup logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('demo_client.log'),
-            logging.StreamHandler()
-        ]
-    )
+    # Setup logging; callers only enqueue records and a listener thread does
+    # the file and console I/O
+    log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('demo_client.log')
+    stream_handler = logging.StreamHandler()
+    file_handler.setFormatter(log_formatter)
+    stream_handler.setFormatter(log_formatter)
+    
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Listener handlers add the prefix
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    log_listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
     
     print("🚀 Starting AI Image Generation Demo Client...")
     
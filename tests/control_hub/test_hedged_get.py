@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Hedged Status Requests
+Tests DemoController.hedged_get backup requests and error propagation
+"""
+
+import unittest
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from unittest.mock import Mock
+import sys
+import os
+
+# Add control hub directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src/control-hub'))
+
+import requests
+from demo_control import DemoController
+
+
+class TestHedgedGet(unittest.TestCase):
+    """Test hedged GET requests against a scripted session."""
+    
+    URL = 'http://127.0.0.1:5000/status'
+    HEDGE_AFTER = 0.05
+    
+    def setUp(self):
+        """Set up a controller whose session.get runs scripted behaviours."""
+        self.controller = DemoController()
+        self.controller.session = Mock()
+        self.release = threading.Event()
+        
+    def tearDown(self):
+        """Let any stalled request finish and stop the worker pool."""
+        self.release.set()
+        self.controller._command_pool.shutdown(wait=True)
+        self.controller._hedge_pool.shutdown(wait=True)
+    
+    def _script(self, *behaviours):
+        """Make the nth session.get call run the nth behaviour."""
+        calls = iter(behaviours)
+        self.controller.session.get.side_effect = lambda url, timeout: next(calls)()
+    
+    def _stall(self, result=None, error=None):
+        """Behaviour that blocks until the test releases it."""
+        def behaviour():
+            self.release.wait(5)
+            if error is not None:
+                raise error
+            return result
+        return behaviour
+    
+    def test_fast_response_sends_no_backup(self):
+        """A response inside the hedge window is returned without a backup request."""
+        response = Mock(status_code=200)
+        self._script(lambda: response)
+        
+        result = self.controller.hedged_get(self.URL, hedge_after=self.HEDGE_AFTER)
+        
+        self.assertIs(result, response)
+        self.assertEqual(self.controller.session.get.call_count, 1)
+    
+    def test_response_just_after_hedge_window_is_returned(self):
+        """A first request that finishes as the hedge wait times out still wins."""
+        response = Mock(status_code=200)
+        
+        class LateFuture(Future):
+            # Completes in the gap between the timed-out wait and done()
+            def result(self, timeout=None):
+                if timeout is not None and not self.done():
+                    self.set_result(response)
+                    raise FutureTimeoutError()
+                return super().result(timeout)
+        
+        self.controller._hedge_pool = Mock(submit=Mock(return_value=LateFuture()))
+        
+        result = self.controller.hedged_get(self.URL, hedge_after=self.HEDGE_AFTER)
+        
+        self.assertIs(result, response)
+        self.assertEqual(self.controller._hedge_pool.submit.call_count, 1)
+    
+    def test_backup_wins_when_first_request_stalls(self):
+        """A stalled first request is overtaken by the backup request."""
+        stalled = Mock(status_code=200, name='stalled')
+        backup = Mock(status_code=200, name='backup')
+        self._script(self._stall(result=stalled), lambda: backup)
+        
+        result = self.controller.hedged_get(self.URL, hedge_after=self.HEDGE_AFTER)
+        
+        self.assertIs(result, backup)
+        self.assertEqual(self.controller.session.get.call_count, 2)
+    
+    def test_fast_failure_is_reraised_without_backup(self):
+        """A request that fails outright is re-raised rather than hedged."""
+        def refuse():
+            raise requests.ConnectionError('connection refused')
+        self._script(refuse)
+        
+        with self.assertRaises(requests.ConnectionError):
+            self.controller.hedged_get(self.URL, hedge_after=self.HEDGE_AFTER)
+        self.assertEqual(self.controller.session.get.call_count, 1)
+    
+    def test_error_raised_when_both_requests_fail(self):
+        """When the first request and the backup both fail, an error is raised."""
+        def refuse_backup():
+            # Let the stalled first request fail too once the backup is out
+            self.release.set()
+            raise requests.ConnectionError('backup refused')
+        self._script(self._stall(error=requests.Timeout('first timed out')), refuse_backup)
+        
+        with self.assertRaises(requests.RequestException):
+            self.controller.hedged_get(self.URL, hedge_after=self.HEDGE_AFTER)
+        self.assertEqual(self.controller.session.get.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Smoke Test for the Standalone Demo aiohttp Server
+Starts emergency_demo/server.py with aiohttp serving and fetches real files
+"""
+
+import importlib.util
+import os
+import socket
+import subprocess
+import sys
+import time
+import unittest
+import urllib.request
+
+DEMO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../emergency_demo'))
+
+# aiohttp's run_app needs the main thread, so the server runs in a child
+# process, as it does from the command line (without opening a browser)
+SERVER_SCRIPT = (
+    "import server; "
+    "server.StandaloneDemoServer({port}, use_aiohttp=True).run(open_browser=False)"
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@unittest.skipUnless(importlib.util.find_spec('aiohttp'), "aiohttp is not installed")
+class TestAiohttpServing(unittest.TestCase):
+    """Fetch the index page and an asset through the aiohttp path."""
+    
+    def setUp(self):
+        """Start the demo server and wait until it answers."""
+        port = _free_port()
+        self.base_url = f"http://127.0.0.1:{port}"
+        self.process = subprocess.Popen(
+            [sys.executable, '-c', SERVER_SCRIPT.format(port=port)],
+            cwd=DEMO_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        
+        deadline = time.time() + 15
+        while True:
+            try:
+                with urllib.request.urlopen(self.base_url + '/', timeout=1):
+                    break
+            except OSError:
+                if self.process.poll() is not None or time.time() > deadline:
+                    self.fail("Demo server did not start")
+                time.sleep(0.1)
+        
+    def tearDown(self):
+        """Stop the demo server."""
+        self.process.terminate()
+        self.process.wait(timeout=10)
+    
+    def _fetch(self, path):
+        with urllib.request.urlopen(self.base_url + path, timeout=5) as response:
+            return response.status, response.headers, response.read()
+    
+    def _read_demo_file(self, *parts):
+        with open(os.path.join(DEMO_DIR, *parts), 'rb') as f:
+            return f.read()
+    
+    def test_index_page(self):
+        """The root URL serves index.html from aiohttp."""
+        status, headers, body = self._fetch('/')
+        
+        self.assertEqual(status, 200)
+        self.assertIn('aiohttp', headers.get('Server', ''))
+        self.assertEqual(body, self._read_demo_file('index.html'))
+    
+    def test_asset(self):
+        """Files under the demo directory are served as static assets."""
+        status, headers, body = self._fetch('/assets/image1.png')
+        
+        self.assertEqual(status, 200)
+        self.assertEqual(headers.get_content_type(), 'image/png')
+        self.assertEqual(body, self._read_demo_file('assets', 'image1.png'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test Suite for PowerShell Function Body Extraction
+Tests _block_end brace matching around comments and string literals
+"""
+
+import unittest
+import sys
+import os
+
+# Add the Intel deployment tests directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../deployment/intel/tests'))
+
+from test_intel_comprehensive import _block_end, _extract_function_bodies
+
+
+class TestBlockEnd(unittest.TestCase):
+    """Test that _block_end finds the brace closing a function body."""
+    
+    def assertBlock(self, body, rest='\nfunction Next { }\n'):
+        """Check that the block starting body ends exactly where body does."""
+        content = body + rest
+        self.assertEqual(content[:_block_end(content, 0)], body)
+    
+    def test_plain_and_nested_blocks(self):
+        """Nested script blocks are matched to the outer closing brace."""
+        self.assertBlock('function Test-Plain {\n    if ($x) { Write-Host "x" }\n}')
+    
+    def test_braces_in_line_comments(self):
+        """Braces after '#' are ignored up to the end of the line."""
+        self.assertBlock('function Test-Comment {\n    # closing } early\n    # { opening more\n    $x = 1\n}')
+    
+    def test_braces_in_block_comments(self):
+        """Braces inside <# #> comments are ignored, across lines."""
+        self.assertBlock('function Test-Help {\n    <#\n    .EXAMPLE\n    { } }\n    #>\n    $x = 1\n}')
+    
+    def test_braces_in_double_quoted_here_strings(self):
+        """Braces inside @" "@ here-strings are ignored."""
+        self.assertBlock('function Test-HereString {\n    $json = @"\n{ "a": { "b": 1 }\n"@\n    $json\n}')
+    
+    def test_braces_in_single_quoted_here_strings(self):
+        """Braces inside @' '@ here-strings are ignored, including stray quotes."""
+        self.assertBlock("function Test-Literal {\n    $text = @'\nit's } literal\n'@\n    $text\n}")
+    
+    def test_braces_in_single_quoted_strings(self):
+        """Braces inside single-quoted strings are ignored."""
+        self.assertBlock("function Test-Single {\n    $open = '{'\n    $close = '}}'\n}")
+    
+    def test_braces_in_double_quoted_strings(self):
+        """Braces inside double-quoted strings are ignored, past escaped quotes."""
+        self.assertBlock('function Test-Double {\n    $msg = "say `"}`" {"\n    $x = "${env:TEMP}"\n}')
+    
+    def test_unclosed_block_runs_to_end(self):
+        """A block that is never closed extends to the end of the content."""
+        content = 'function Test-Open {\n    if ($x) {\n}'
+        self.assertEqual(_block_end(content, 0), len(content))
+    
+    def test_extract_function_bodies(self):
+        """Each function body is cut at its own closing brace."""
+        content = 'function A {\n    "}"\n}\nfunction B {\n    # {\n}\n'
+        functions = [('A', 0), ('B', content.index('function B'))]
+        
+        bodies = _extract_function_bodies(content, functions)
+        
+        self.assertEqual(bodies['A'], 'function A {\n    "}"\n}')
+        self.assertEqual(bodies['B'], 'function B {\n    # {\n}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -400,5 +400,63 @@ class TestSocketIOPerformance(unittest.TestCase):
         print(f"Polling: {polling_bandwidth} bytes, WebSocket: {websocket_bandwidth} bytes")
 
 
+class TestStatusCoalescing(unittest.TestCase):
+    """Test NetworkServer.queue_status coalescing of status pushes."""
+    
+    def setUp(self):
+        """Build a NetworkServer around a threading-mode Socket.IO server."""
+        from demo_client import NetworkServer
+        
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        
+        # Skip __init__, which wires up the full route table and display
+        self.server = NetworkServer.__new__(NetworkServer)
+        self.server.app = self.app
+        self.server.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        self.server.logger = Mock()
+        self.server._pending_status = None
+        self.server._flush_scheduled = False
+        self.server._status_lock = threading.Lock()
+        
+        self.socketio_client = self.server.socketio.test_client(self.app)
+        
+    def tearDown(self):
+        """Clean up after tests."""
+        if self.socketio_client.is_connected():
+            self.socketio_client.disconnect()
+    
+    def _wait_for_flush(self):
+        deadline = time.time() + 2
+        while self.server._flush_scheduled and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(self.server._flush_scheduled)
+    
+    def test_queued_snapshots_emit_one_status_event(self):
+        """Two snapshots queued within the flush window send only the latest."""
+        self.socketio_client.get_received()
+        
+        self.server.queue_status({'status': 'generating', 'current_step': 1})
+        self.server.queue_status({'status': 'generating', 'current_step': 2})
+        self._wait_for_flush()
+        
+        status_events = [msg for msg in self.socketio_client.get_received() if msg['name'] == 'status']
+        self.assertEqual(len(status_events), 1)
+        self.assertEqual(status_events[0]['args'][0]['current_step'], 2)
+        self.server.logger.debug.assert_not_called()
+    
+    def test_queue_status_schedules_again_after_flush(self):
+        """A snapshot queued after a flush is delivered by a new flush."""
+        self.socketio_client.get_received()
+        
+        self.server.queue_status({'status': 'generating', 'current_step': 1})
+        self._wait_for_flush()
+        self.server.queue_status({'status': 'completed', 'current_step': 20})
+        self._wait_for_flush()
+        
+        status_events = [msg for msg in self.socketio_client.get_received() if msg['name'] == 'status']
+        self.assertEqual([msg['args'][0]['current_step'] for msg in status_events], [1, 20])
+
+
 if __name__ == '__main__':
     unittest.main()